@@ -7,5 +7,4 @@ class AccountsConfig(AppConfig):
     verbose_name = "User Accounts"
 
     def ready(self):
-        # Import signals here if needed in the future
-        pass
+        from . import signals  # noqa: F401
@@ -0,0 +1,68 @@
+"""
+JWT authentication that serves request.user from the cache.
+
+The stock JWTAuthentication runs a SELECT on accounts_user for every API
+call. Users are cached per (user id, token issue time) under a per-user
+version counter, which the User signals bump on every save or delete, so
+role changes, verification and deactivation take effect on the next request.
+
+A bump only reaches the workers that share the cache, so with a process-local
+backend (the default local-memory cache) every request reads the user from
+the database as before.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .tokens import shared_cache
+
+USER_CACHE_TIMEOUT = getattr(settings, "USER_CACHE_TIMEOUT", 60 * 5)
+
+
+def _version_key(user_id):
+    return f"accounts:user-version:{user_id}"
+
+
+def get_user_version(user_id):
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        # Seeded from the clock so an evicted counter never repeats a version
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_user(user_id):
+    """Drop every cached copy of a user"""
+    key = _version_key(user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication with a short-lived user cache"""
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+        if not shared_cache():
+            return super().get_user(validated_token)
+
+        key = "accounts:user:{}:{}:{}".format(
+            user_id, get_user_version(user_id), validated_token.get("iat", "")
+        )
+        user = cache.get(key)
+        if user is None:
+            # Also rejects inactive users, so only active ones are cached
+            user = super().get_user(validated_token)
+            cache.set(key, user, USER_CACHE_TIMEOUT)
+        return user
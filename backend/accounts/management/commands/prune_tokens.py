@@ -0,0 +1,57 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.utils import aware_utcnow
+
+from accounts import tokens
+
+
+class Command(BaseCommand):
+    help = 'Delete expired outstanding and blacklisted JWT tokens in small batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows deleted per transaction',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=0.1,
+            help='Seconds to pause between batches so other writers get the tables',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        now = aware_utcnow()
+        expired = OutstandingToken.objects.filter(expires_at__lte=now).order_by('id')
+
+        deleted = 0
+        while True:
+            ids = list(expired.values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            # Short transactions keep row locks brief on a busy refresh endpoint
+            with transaction.atomic():
+                BlacklistedToken.objects.filter(token_id__in=ids).delete()
+                OutstandingToken.objects.filter(id__in=ids).delete()
+            deleted += len(ids)
+            self.stdout.write(f'Deleted {deleted} expired tokens...')
+            if len(ids) < batch_size:
+                break
+            time.sleep(options['sleep'])
+
+        if deleted:
+            # Rebuild the blacklist filter without the pruned tokens
+            tokens.reset_filter()
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Pruned {deleted} expired tokens')
+        )
@@ -1,8 +1,12 @@
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
 
 from .models import User
+from .tokens import FilteredRefreshToken
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -118,6 +122,14 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         return data
 
 
+class FilteredTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Token refresh that checks the blacklist through the shared filter
+    """
+
+    token_class = FilteredRefreshToken
+
+
 class ChangePasswordSerializer(serializers.Serializer):
     """
     Serializer for password change
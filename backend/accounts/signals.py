@@ -0,0 +1,23 @@
+"""
+Signal handlers for user accounts.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from . import tokens
+from .authentication import invalidate_user
+from .models import User
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def invalidate_blacklist_filter(sender, instance, created, **kwargs):
+    if created:
+        # After commit, so a filter rebuilt for the new version sees the row
+        transaction.on_commit(tokens.bump_version)
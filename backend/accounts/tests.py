@@ -0,0 +1,66 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+from . import tokens
+from .authentication import CachedJWTAuthentication
+
+User = get_user_model()
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("admin", "admin@example.com", "pw", role="ADMIN")
+
+    def setUp(self):
+        cache.clear()
+        self.token = AccessToken.for_user(self.user)
+
+    def test_process_local_cache_reads_the_database(self):
+        authentication = CachedJWTAuthentication()
+        authentication.get_user(self.token)
+        with self.assertNumQueries(1):
+            authentication.get_user(self.token)
+
+    def test_shared_cache_serves_the_user(self):
+        authentication = CachedJWTAuthentication()
+        with mock.patch("accounts.authentication.shared_cache", return_value=True):
+            authentication.get_user(self.token)
+            with self.assertNumQueries(0):
+                self.assertEqual(authentication.get_user(self.token), self.user)
+
+
+class BlacklistFilterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        tokens.reset_filter()
+
+    def blacklist(self, jti, pk=None, **fields):
+        outstanding = OutstandingToken.objects.create(
+            jti=jti, token=jti, expires_at=aware_utcnow() + timedelta(days=1)
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            return BlacklistedToken.objects.create(pk=pk, token=outstanding, **fields)
+
+    def test_catch_up_adds_new_rows(self):
+        self.blacklist("first")
+        self.assertIn("first", tokens.get_filter()["filter"])
+        self.blacklist("second")
+        self.assertIn("second", tokens.get_filter()["filter"])
+
+    def test_catch_up_finds_rows_committed_out_of_order(self):
+        self.blacklist("newest", pk=10)
+        tokens.get_filter()
+        # A row with a lower id and an earlier timestamp that committed late
+        row = self.blacklist("late", pk=5)
+        BlacklistedToken.objects.filter(pk=row.pk).update(
+            blacklisted_at=aware_utcnow() - timedelta(minutes=1)
+        )
+        self.assertIn("late", tokens.get_filter()["filter"])
@@ -0,0 +1,160 @@
+"""
+Refresh tokens whose blacklist check usually skips the database.
+
+A bloom filter of blacklisted JTIs is shared through the cache together with
+the time its rows were last read and the blacklist version it was built at.
+Every new BlacklistedToken row bumps the version, so a filter tagged with the
+current version is known to be complete: if the filter says "absent", the
+token is not blacklisted and no query is needed. A stale filter is caught up
+by reading the rows blacklisted since its last read, less an overlap window:
+rows commit out of id and timestamp order, so a row stamped just before the
+read may only become visible after it. Filter hits still go to the database,
+so false positives cost a query but never reject a valid token.
+
+The version counter must be visible to every worker, so the filter is only
+used with a shared cache backend. With the default local-memory cache every
+check goes to the database as before.
+"""
+import hashlib
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+VERSION_KEY = "accounts:blacklist-version"
+FILTER_KEY = "accounts:blacklist-filter"
+
+# ~1% false positives at capacity
+BITS_PER_ENTRY = 10
+HASH_COUNT = 7
+MIN_CAPACITY = 1024
+
+# Longest a blacklisting transaction may take to commit and still be caught up
+CATCH_UP_OVERLAP = timedelta(minutes=5)
+
+PROCESS_LOCAL_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+# Last filter this process used, so the common case is one cache read
+_local_filter = None
+
+
+def shared_cache():
+    """Whether every worker sees the same cache, and so the same version counters"""
+    return settings.CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_BACKENDS
+
+
+def filter_enabled():
+    return getattr(settings, "TOKEN_BLACKLIST_FILTER", True) and shared_cache()
+
+
+class BloomFilter:
+    def __init__(self, capacity, bits=None):
+        self.capacity = max(capacity, MIN_CAPACITY)
+        self.size = self.capacity * BITS_PER_ENTRY
+        self.bits = bytearray(bits) if bits else bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = hashlib.sha256(value.encode()).digest()
+        for i in range(HASH_COUNT):
+            yield int.from_bytes(digest[i * 4 : i * 4 + 4], "big") % self.size
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position // 8] |= 1 << (position % 8)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(
+            self.bits[position // 8] & (1 << (position % 8))
+            for position in self._positions(value)
+        )
+
+
+def get_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # Seeded from the clock so an evicted counter never matches an old filter
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_version():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def reset_filter():
+    """Drop the shared filter; the next check rebuilds it from live rows"""
+    global _local_filter
+    _local_filter = None
+    cache.delete(FILTER_KEY)
+    bump_version()
+
+
+def _blacklisted_jtis(since=None):
+    rows = BlacklistedToken.objects.filter(token__expires_at__gt=aware_utcnow())
+    if since is not None:
+        rows = rows.filter(blacklisted_at__gte=since - CATCH_UP_OVERLAP)
+    return rows.values_list("token__jti", flat=True)
+
+
+def _build(version, previous=None):
+    """Catch `previous` up to the database, or build a new filter"""
+    read_at = aware_utcnow()
+    # Filters cached before read times were recorded are rebuilt
+    if previous is not None and "read_at" in previous:
+        bloom = previous["filter"]
+        # Rows in the overlap are added again; that only counts them twice
+        jtis = list(_blacklisted_jtis(previous["read_at"]))
+        if bloom.count + len(jtis) > bloom.capacity:
+            previous = None
+    else:
+        previous = None
+    if previous is None:
+        jtis = list(_blacklisted_jtis())
+        bloom = BloomFilter(len(jtis) * 2)
+    for jti in jtis:
+        bloom.add(jti)
+    return {"version": version, "read_at": read_at, "filter": bloom}
+
+
+def get_filter():
+    """A blacklist filter that is complete as of the current version"""
+    global _local_filter
+    # Read the version before any rows so the filter is never newer than its tag
+    version = get_version()
+    if _local_filter is not None and _local_filter["version"] == version:
+        return _local_filter
+    shared = cache.get(FILTER_KEY)
+    if shared is None or shared["version"] != version:
+        shared = _build(version, shared or _local_filter)
+        cache.set(FILTER_KEY, shared, timeout=None)
+    _local_filter = shared
+    return shared
+
+
+def is_blacklisted(jti):
+    if filter_enabled() and jti not in get_filter()["filter"]:
+        return False
+    return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+
+class FilteredRefreshToken(RefreshToken):
+    """RefreshToken whose blacklist check goes through the shared filter"""
+
+    def check_blacklist(self):
+        if is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError("Token is blacklisted")
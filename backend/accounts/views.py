@@ -15,6 +15,7 @@ from .serializers import (
     UpdateProfileSerializer,
     UserSerializer,
 )
+from .tokens import FilteredRefreshToken
 
 
 class RegisterView(generics.CreateAPIView):
@@ -71,7 +72,7 @@ class LogoutView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            token = RefreshToken(refresh_token)
+            token = FilteredRefreshToken(refresh_token)
             token.blacklist()
 
             return Response(
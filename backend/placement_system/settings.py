@@ -83,6 +83,31 @@ else:
         }
     }
 
+# Cache
+# Local memory by default. With several gunicorn workers, point every worker
+# at a shared backend so cache invalidation reaches all of them, e.g.
+#   CACHE_BACKEND=django.core.cache.backends.db.DatabaseCache
+#   CACHE_LOCATION=cache_table   (then run `python manage.py createcachetable`)
+# or django.core.cache.backends.redis.RedisCache with a redis:// location.
+CACHES = {
+    "default": {
+        "BACKEND": config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        "LOCATION": config('CACHE_LOCATION', default='placement-system'),
+    }
+}
+
+# Seconds a cached catalog response may be served before it is rebuilt
+RESPONSE_CACHE_TIMEOUT = config('RESPONSE_CACHE_TIMEOUT', default=900, cast=int)
+
+# Seconds an authenticated user is served from the cache instead of the database
+USER_CACHE_TIMEOUT = config('USER_CACHE_TIMEOUT', default=300, cast=int)
+
+# Threads used to build the /api/dashboard/ panels concurrently (1 = serially)
+DASHBOARD_MAX_WORKERS = config('DASHBOARD_MAX_WORKERS', default=4, cast=int)
+
+# Processes hashing passwords when student accounts are created in bulk (0 = one per CPU)
+PASSWORD_HASH_WORKERS = config('PASSWORD_HASH_WORKERS', default=0, cast=int)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -124,7 +149,7 @@ AUTH_USER_MODEL = "accounts.User"
 # REST Framework settings
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.CachedJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
@@ -151,8 +176,13 @@ SIMPLE_JWT = {
     "USER_ID_CLAIM": "user_id",
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
     "TOKEN_TYPE_CLAIM": "token_type",
+    "TOKEN_REFRESH_SERIALIZER": "accounts.serializers.FilteredTokenRefreshSerializer",
 }
 
+# Check refresh tokens against a cached bloom filter of the blacklist before
+# querying it. Only takes effect with a shared CACHE_BACKEND.
+TOKEN_BLACKLIST_FILTER = config('TOKEN_BLACKLIST_FILTER', default=True, cast=bool)
+
 # CORS settings
 CORS_ALLOW_ALL_ORIGINS = config('CORS_ALLOW_ALL_ORIGINS', default=False, cast=bool)
 
@@ -164,6 +194,9 @@ CORS_ALLOWED_ORIGINS = config(
 
 CORS_ALLOW_CREDENTIALS = True
 
+# Let the frontend read per-panel timings of /api/dashboard/
+CORS_EXPOSE_HEADERS = ["Server-Timing"]
+
 # Security settings for production
 if not DEBUG:
     SECURE_SSL_REDIRECT = True
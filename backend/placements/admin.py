@@ -1,6 +1,8 @@
 from django.contrib import admin
 from django.contrib.auth import get_user_model
-from .models import Student, Company, PlacementStage, PlacementProgress, StageProgress, ImportantDate
+from .models import Student, Company, PlacementStage, PlacementProgress, StageProgress, ImportantDate, StudentImportJob
+from .jobs import enqueue_account_provisioning
+from .provisioning import default_password, user_fields
 
 User = get_user_model()
 
@@ -11,6 +13,7 @@ class StudentAdmin(admin.ModelAdmin):
     list_filter = ['branch', 'year', 'is_placed']
     search_fields = ['enrollment_number', 'name', 'email']
     ordering = ['-created_at']
+    actions = ['create_user_accounts']
     
     def save_model(self, request, obj, form, change):
         """
@@ -30,16 +33,8 @@ class StudentAdmin(admin.ModelAdmin):
                 obj.save()
             else:
                 # Create new user account
-                password = f"{obj.name.split()[0].lower()}{obj.enrollment_number[-4:]}"
-                user = User.objects.create_user(
-                    username=username,
-                    email=obj.email,
-                    password=password,
-                    first_name=obj.name.split()[0] if obj.name else '',
-                    last_name=' '.join(obj.name.split()[1:]) if len(obj.name.split()) > 1 else '',
-                    role='STUDENT',
-                    phone=obj.phone
-                )
+                password = default_password(obj)
+                user = User.objects.create_user(password=password, **user_fields(obj))
                 obj.user = user
                 obj.save()
                 self.message_user(request, f"User account created: {username} / Password: {password}")
@@ -51,6 +46,20 @@ class StudentAdmin(admin.ModelAdmin):
                 obj.user = existing_user
                 obj.save()
 
+    @admin.action(description='Create user accounts for selected students')
+    def create_user_accounts(self, request, queryset):
+        """Queue account creation; hashing runs in the process_import_jobs worker"""
+        student_ids = list(queryset.filter(user__isnull=True).values_list("pk", flat=True))
+        if not student_ids:
+            self.message_user(request, "All selected students already have user accounts.")
+            return
+        job = enqueue_account_provisioning(student_ids, request.user)
+        self.message_user(
+            request,
+            f"Queued job {job.pk} to create user accounts for {len(student_ids)} students. "
+            f"Default password: first name + last 4 characters of the enrollment number.",
+        )
+
 
 @admin.register(Company)
 class CompanyAdmin(admin.ModelAdmin):
@@ -86,4 +95,13 @@ class ImportantDateAdmin(admin.ModelAdmin):
     list_display = ['title', 'event_type', 'company', 'event_date', 'is_active']
     list_filter = ['event_type', 'is_active']
     search_fields = ['title', 'company__name']
-    ordering = ['event_date']
\ No newline at end of file
+    ordering = ['event_date']
+
+
+@admin.register(StudentImportJob)
+class StudentImportJobAdmin(admin.ModelAdmin):
+    list_display = ['file_name', 'kind', 'status', 'processed_rows', 'created_count', 'updated_count', 'created_by', 'created_at']
+    list_filter = ['kind', 'status']
+    exclude = ['payload']
+    readonly_fields = ['processed_rows', 'created_count', 'updated_count', 'errors', 'started_at', 'finished_at']
+    ordering = ['-created_at']
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class PlacementsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "placements"
+
+    def ready(self):
+        # Register the signal handlers that keep derived data in sync
+        from . import signals  # noqa: F401
@@ -0,0 +1,166 @@
+"""
+Endpoint benchmarks with recorded baselines.
+
+`run_case` times one endpoint for one role: a warm-up request, `repeat`
+timed requests for the latency percentiles, then one profiled request for
+the query count and the peak Python memory (tracemalloc slows requests
+down, so it never overlaps the timed ones). `compare` checks a run against
+a stored baseline and lists every regression past the thresholds. Latencies
+are wall-clock numbers of one machine, so they are only compared against a
+baseline recorded on the same host with enough timed requests.
+
+Requests go through the test client with a real JWT, so authentication,
+middleware, rendering and the database are all part of the measurement.
+"""
+import io
+import math
+import time
+import tracemalloc
+
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .datasets import BRANCHES
+
+UPLOAD_ROWS = 500
+
+# Differences below these are noise, whatever the relative change
+MIN_LATENCY_DELTA_MS = 2.0
+MIN_MEMORY_DELTA_KB = 64.0
+
+# With fewer timed requests p95 is one of the slowest couple of samples
+MIN_COMPARE_REPEAT = 20
+
+
+def upload_payload(rows=UPLOAD_ROWS):
+    lines = ["enrollment_number,name,email,phone,branch,year,cgpa,skills,is_placed\n"]
+    for i in range(rows):
+        lines.append(
+            f"UPLOAD{i:07d},Upload Student {i},upload{i}@example.com,97{i:08d},"
+            f"{BRANCHES[i % len(BRANCHES)]},4,{6 + (i % 400) / 100:.2f},"
+            f"\"Python, SQL\",FALSE\n"
+        )
+    return "".join(lines).encode("utf-8")
+
+
+def get_request(path):
+    def request(client):
+        # Over HTTPS, since settings with DEBUG off redirect plain HTTP
+        return client.get(path, secure=True)
+
+    return request
+
+
+def upload_csv(client):
+    csv_file = io.BytesIO(upload_payload())
+    csv_file.name = "students.csv"
+    # Roll the import back so every run inserts the same rows
+    with transaction.atomic():
+        response = client.post("/api/students/upload_csv/", {"file": csv_file}, secure=True)
+        transaction.set_rollback(True)
+    return response
+
+
+# name: (request, roles)
+ENDPOINTS = {
+    "placement_progress": (get_request("/api/placement-progress/"), ("admin", "student")),
+    "statistics": (get_request("/api/placement-progress/statistics/"), ("admin", "student")),
+    "students": (get_request("/api/students/"), ("admin", "student")),
+    "dashboard": (get_request("/api/dashboard/"), ("admin", "student")),
+    "upload_csv": (upload_csv, ("admin",)),
+}
+
+
+def client_for(user):
+    return Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of `samples`"""
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _send(request, client):
+    response = request(client)
+    # A redirect would time the redirect, not the endpoint
+    if response.status_code >= 300:
+        raise RuntimeError(f"HTTP {response.status_code}: {response.content[:200]!r}")
+    return response
+
+
+def run_case(request, client, repeat):
+    """Latency percentiles (ms), query count and peak memory (KB) of one endpoint"""
+    _send(request, client)
+
+    latencies = []
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        _send(request, client)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        # Inside a transaction the dashboard runs its panels on this
+        # connection, so their queries are captured too
+        with transaction.atomic(), CaptureQueriesContext(connection) as queries:
+            _send(request, client)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return {
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "queries": len(queries.captured_queries),
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
+
+
+def case_key(size, endpoint, role):
+    return f"{size}/{endpoint}/{role}"
+
+
+def compare(
+    results, baseline, threshold=0.25, memory_threshold=0.25, extra_queries=0, latency=True
+):
+    """
+    Regressions of `results` against `baseline` (both keyed by case_key),
+    as human-readable strings. Cases missing from the baseline are skipped,
+    and so are latencies unless `latency` is set.
+    """
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        for metric in ("p50_ms", "p95_ms"):
+            limit = previous[metric] * (1 + threshold)
+            if (
+                latency
+                and current[metric] > limit
+                and current[metric] - previous[metric] > MIN_LATENCY_DELTA_MS
+            ):
+                regressions.append(
+                    f"{key}: {metric} {current[metric]} > {previous[metric]} (+{threshold:.0%})"
+                )
+        if current["queries"] > previous["queries"] + extra_queries:
+            regressions.append(f"{key}: queries {current['queries']} > {previous['queries']}")
+        limit = previous["peak_memory_kb"] * (1 + memory_threshold)
+        if (
+            current["peak_memory_kb"] > limit
+            and current["peak_memory_kb"] - previous["peak_memory_kb"] > MIN_MEMORY_DELTA_KB
+        ):
+            regressions.append(
+                f"{key}: peak memory {current['peak_memory_kb']}KB > "
+                f"{previous['peak_memory_kb']}KB (+{memory_threshold:.0%})"
+            )
+    return regressions
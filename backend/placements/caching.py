@@ -0,0 +1,94 @@
+"""
+Version counters for cached placement data.
+
+Every cached value is keyed by the version of the models it was built from.
+Saving or deleting a row bumps that model's version, so stale entries are
+never read again and simply expire.
+"""
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+VERSION_KEY_PREFIX = "placements:version:"
+
+RESPONSE_CACHE_TIMEOUT = getattr(settings, "RESPONSE_CACHE_TIMEOUT", 60 * 15)
+
+
+def _version_key(name):
+    return f"{VERSION_KEY_PREFIX}{name}"
+
+
+def get_versions(*names):
+    """Current version of each named counter, initialising missing ones"""
+    keys = {name: _version_key(name) for name in names}
+    found = cache.get_many(keys.values())
+    versions = {}
+    for name, key in keys.items():
+        version = found.get(key)
+        if version is None:
+            # Seed from the clock so a counter that was evicted never
+            # reuses a version that older cache entries were built with
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+        versions[name] = version
+    return versions
+
+
+def bump_version(*names):
+    for name in names:
+        key = _version_key(name)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), timeout=None)
+
+
+def versioned_key(prefix, versions, *parts):
+    """Build a cache key that changes whenever one of `versions` is bumped"""
+    version_part = ".".join(f"{name}{versions[name]}" for name in sorted(versions))
+    return ":".join(["placements", prefix, version_part, *map(str, parts)])
+
+
+def _plain(data):
+    """Copy serializer output into plain lists/dicts so it can be pickled"""
+    if isinstance(data, dict):
+        return {key: _plain(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_plain(item) for item in data]
+    return data
+
+
+def cached_response(*version_names, timeout=None):
+    """
+    Cache a viewset action's response data under the versions of the models
+    it reads. Permissions are still checked on every request; only the
+    queryset evaluation and serialization are skipped on a hit.
+    """
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            versions = get_versions(*version_names)
+            path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+            key = versioned_key("response", versions, self.basename, self.action, path)
+
+            data = cache.get(key)
+            if data is not None:
+                return Response(data)
+
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(
+                    key,
+                    _plain(response.data),
+                    RESPONSE_CACHE_TIMEOUT if timeout is None else timeout,
+                )
+            return response
+
+        return wrapper
+
+    return decorator
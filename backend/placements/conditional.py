@@ -0,0 +1,119 @@
+"""
+Conditional GET (ETag / Last-Modified) for the placements API.
+
+Validators come from a cheap probe: MAX(updated_at) and COUNT(*) over the
+queryset the endpoint would serialize, plus the cache version counters of
+related models whose fields appear in the payload. A matching
+If-None-Match or If-Modified-Since gets a 304 before any serialization.
+"""
+import hashlib
+from functools import wraps
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+from . import caching
+
+
+def make_etag(*parts):
+    return quote_etag(hashlib.md5("|".join(map(str, parts)).encode()).hexdigest())
+
+
+def probe(queryset, timestamp_field="updated_at"):
+    """(last_modified, count) of a queryset in a single aggregate query"""
+    aggregates = {"count": Count("pk")}
+    if timestamp_field:
+        aggregates["last_modified"] = Max(timestamp_field)
+    result = queryset.order_by().aggregate(**aggregates)
+    return result.get("last_modified"), result["count"]
+
+
+def conditional_get(validators):
+    """
+    Answer GET/HEAD with 304 Not Modified when the request's validators
+    match. `validators` names a view method returning (etag, last_modified);
+    last_modified may be None, and an etag of None skips the check.
+    Nested decorators only probe once.
+    """
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD") or getattr(
+                request, "_conditional_checked", False
+            ):
+                return view_method(self, request, *args, **kwargs)
+            request._conditional_checked = True
+
+            etag, last_modified = getattr(self, validators)(request, *args, **kwargs)
+            if etag is None:
+                return view_method(self, request, *args, **kwargs)
+            timestamp = int(last_modified.timestamp()) if last_modified else None
+            response = get_conditional_response(
+                request, etag=etag, last_modified=timestamp
+            )
+            if response is None:
+                response = view_method(self, request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                response["ETag"] = etag
+                if timestamp is not None:
+                    response["Last-Modified"] = http_date(timestamp)
+                # Let browsers store the response but revalidate every time
+                patch_cache_control(response, private=True, no_cache=True)
+                patch_vary_headers(response, ["Authorization"])
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+class ConditionalGetMixin:
+    """
+    ETag support for list and retrieve. `conditional_versions` lists the
+    cache version counters (see placements.caching) of related models the
+    serializer reads; `conditional_timestamp_field` is None for models
+    without an updated_at column.
+    """
+
+    conditional_versions = ()
+    conditional_timestamp_field = "updated_at"
+
+    def get_validator_parts(self, request):
+        versions = caching.get_versions(*self.conditional_versions)
+        return [
+            request.user.pk,
+            request.get_full_path(),
+            *(f"{name}:{versions[name]}" for name in sorted(versions)),
+        ]
+
+    def get_list_validators(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        last_modified, count = probe(queryset, self.conditional_timestamp_field)
+        etag = make_etag(*self.get_validator_parts(request), last_modified, count)
+        # Deleting a row does not move MAX(updated_at), so lists only get an ETag
+        return etag, None
+
+    def get_detail_validators(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: kwargs[lookup_url_kwarg]}
+            )
+            last_modified, count = probe(queryset, self.conditional_timestamp_field)
+        except (ValueError, TypeError, ValidationError):
+            # A malformed lookup value; let get_object() answer with its 404
+            return None, None
+        etag = make_etag(*self.get_validator_parts(request), last_modified, count)
+        # Related rows can change without touching this one's updated_at
+        return etag, None if self.conditional_versions else last_modified
+
+    @conditional_get("get_list_validators")
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @conditional_get("get_detail_validators")
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
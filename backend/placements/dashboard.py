@@ -0,0 +1,153 @@
+"""
+Aggregate payload for /api/dashboard/.
+
+The dashboard used to make one request per panel, each paying for JWT
+authentication and a user lookup. `build_dashboard` returns every panel
+for the caller's role in one response. The panels are independent, so
+their queries run concurrently on a process-wide thread pool. Each worker
+thread has its own database connection, which is recycled the way Django
+recycles request connections, so CONN_MAX_AGE keeps it open between
+dashboards.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+from .models import Company, ImportantDate, PlacementProgress
+from .scoping import can_see_all, get_student_id, scope_queryset
+from .serializers import (
+    CompanySerializer,
+    ImportantDateSerializer,
+    PlacementProgressSerializer,
+)
+from .statistics import get_statistics
+
+DASHBOARD_MAX_WORKERS = getattr(settings, "DASHBOARD_MAX_WORKERS", 4)
+
+RECENT_UPDATES_LIMIT = 10
+UPCOMING_EVENTS_LIMIT = 10
+ACTIVE_COMPANIES_LIMIT = 6
+
+
+def _serialize(serializer_class, queryset, request):
+    queryset = serializer_class.setup_eager_loading(queryset)
+    return serializer_class(queryset, many=True, context={"request": request}).data
+
+
+def statistics_panel(request):
+    return get_statistics()
+
+
+def recent_updates_panel(request):
+    queryset = scope_queryset(request, PlacementProgress.objects.all(), "student")
+    return _serialize(
+        PlacementProgressSerializer,
+        queryset.order_by("-updated_at")[:RECENT_UPDATES_LIMIT],
+        request,
+    )
+
+
+def my_placements_panel(request):
+    queryset = scope_queryset(request, PlacementProgress.objects.all(), "student")
+    return _serialize(PlacementProgressSerializer, queryset, request)
+
+
+def active_companies_panel(request):
+    queryset = Company.objects.filter(is_active=True)[:ACTIVE_COMPANIES_LIMIT]
+    return _serialize(CompanySerializer, queryset, request)
+
+
+def upcoming_events_panel(request):
+    queryset = ImportantDate.objects.filter(
+        event_date__gte=timezone.now(), is_active=True
+    ).order_by("event_date")[:UPCOMING_EVENTS_LIMIT]
+    return _serialize(ImportantDateSerializer, queryset, request)
+
+
+ADMIN_PANELS = {
+    "statistics": statistics_panel,
+    "recent_updates": recent_updates_panel,
+    "upcoming_events": upcoming_events_panel,
+}
+
+STUDENT_PANELS = {
+    "my_placements": my_placements_panel,
+    "active_companies": active_companies_panel,
+    "upcoming_events": upcoming_events_panel,
+}
+
+OTHER_PANELS = {
+    "statistics": statistics_panel,
+    "upcoming_events": upcoming_events_panel,
+}
+
+
+def panels_for(user):
+    if can_see_all(user):
+        return ADMIN_PANELS
+    if user.is_student:
+        return STUDENT_PANELS
+    return OTHER_PANELS
+
+
+def _timed(panel, request):
+    start = time.perf_counter()
+    data = panel(request)
+    return data, (time.perf_counter() - start) * 1000
+
+
+def _timed_in_thread(panel, request):
+    # Workers outlive requests, so apply the request_started/finished cleanup
+    close_old_connections()
+    try:
+        return _timed(panel, request)
+    finally:
+        close_old_connections()
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=DASHBOARD_MAX_WORKERS, thread_name_prefix="dashboard"
+            )
+    return _executor
+
+
+def build_dashboard(request):
+    """
+    Returns (data, timings): the caller's panels by name, and how many
+    milliseconds each one took
+    """
+    panels = panels_for(request.user)
+    # Resolve the student once here; workers only read the cached value
+    get_student_id(request)
+
+    if DASHBOARD_MAX_WORKERS <= 1 or connection.in_atomic_block:
+        # Other threads cannot see this connection's uncommitted rows
+        results = {name: _timed(panel, request) for name, panel in panels.items()}
+    else:
+        executor = get_executor()
+        futures = {
+            name: executor.submit(_timed_in_thread, panel, request)
+            for name, panel in panels.items()
+        }
+        results = {name: future.result() for name, future in futures.items()}
+
+    data = {name: result[0] for name, result in results.items()}
+    timings = {name: result[1] for name, result in results.items()}
+    return data, timings
+
+
+def server_timing(timings):
+    """Format per-panel durations as a Server-Timing header value"""
+    return ", ".join(f"{name};dur={duration:.1f}" for name, duration in timings.items())
@@ -0,0 +1,302 @@
+"""
+Deterministic synthetic placement data at load-testing scale.
+
+`DatasetGenerator` writes students, companies, placement progress and stage
+progress with bulk inserts, one transaction per batch of students. The
+progress tables hold ten or more rows per student, so they skip model
+instances and go through multi-row INSERT statements directly. Bulk
+inserts skip the model signals, so the derived data those signals keep
+current (eligibility, skills and search indexes, the statistics snapshot
+and the cache versions) is written alongside or rebuilt at the end.
+
+The same seed and knobs always produce the same rows.
+"""
+import random
+import time
+from decimal import Decimal
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from . import caching, eligibility, search, skills, statistics
+from .models import (
+    Company,
+    CompanyEligibleBranch,
+    PlacementProgress,
+    PlacementStage,
+    StageProgress,
+    Student,
+)
+
+DEFAULT_STAGES = [
+    ("Application Submission", "APPLICATION"),
+    ("Aptitude Test", "APTITUDE"),
+    ("Technical Round 1", "TECHNICAL1"),
+    ("Technical Round 2", "TECHNICAL2"),
+    ("HR Round", "HR"),
+    ("Final Selection", "FINAL"),
+]
+
+FIRST_NAMES = [
+    "Aarav", "Aditi", "Arjun", "Diya", "Ishaan", "Kavya", "Meera", "Nikhil",
+    "Priya", "Rahul", "Riya", "Rohan", "Sanya", "Siddharth", "Tanvi", "Vikram",
+]
+LAST_NAMES = [
+    "Agarwal", "Bose", "Chopra", "Das", "Gupta", "Iyer", "Joshi", "Kumar",
+    "Mehta", "Nair", "Patel", "Rao", "Reddy", "Shah", "Singh", "Verma",
+]
+SKILLS = [
+    "Python", "Java", "C++", "JavaScript", "React", "Django", "SQL", "AWS",
+    "Docker", "Machine Learning", "Data Structures", "Node.js", "Go", "Linux",
+]
+ROLES = [
+    "Software Engineer", "Data Analyst", "Backend Developer", "Frontend Developer",
+    "DevOps Engineer", "Graduate Engineer Trainee", "Product Analyst",
+]
+LOCATIONS = ["Bangalore", "Hyderabad", "Pune", "Chennai", "Gurgaon", "Mumbai", "Noida"]
+
+BRANCHES = [branch for branch, _ in Student.BRANCH_CHOICES]
+COMPANY_TYPES = [company_type for company_type, _ in Company.COMPANY_TYPE_CHOICES]
+OFFER_OUTCOMES = ["SELECTED", "OFFER_RECEIVED", "OFFER_ACCEPTED", "OFFER_DECLINED"]
+
+# Rows per INSERT where the backend sets no parameter limit
+MAX_ROWS_PER_INSERT = 1000
+
+
+class DatasetError(Exception):
+    pass
+
+
+class DatasetExists(DatasetError):
+    pass
+
+
+def insert_rows(model, columns, rows):
+    """
+    INSERT `rows` (tuples of database-ready values for `columns`) into the
+    model's table with as many rows per statement as the backend allows
+    """
+    if not rows:
+        return
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    column_list = ", ".join(quote(model._meta.get_field(column).column) for column in columns)
+    row_sql = f"({', '.join(['%s'] * len(columns))})"
+    max_params = connection.features.max_query_params
+    per_statement = MAX_ROWS_PER_INSERT
+    if max_params:
+        per_statement = min(per_statement, max_params // len(columns))
+
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), per_statement):
+            chunk = rows[start:start + per_statement]
+            cursor.execute(
+                f"INSERT INTO {table} ({column_list}) VALUES {', '.join([row_sql] * len(chunk))}",
+                [value for row in chunk for value in row],
+            )
+
+
+class DatasetGenerator:
+    """
+    Generate `students` students applying to `applications` of `companies`
+    companies each, advancing through at most `stage_depth` stages.
+    Generated rows are tagged with `prefix` (enrollment numbers, emails and
+    company names) so several datasets can share a database.
+    """
+
+    def __init__(
+        self,
+        students=1000,
+        companies=50,
+        applications=10,
+        stage_depth=None,
+        seed=42,
+        prefix="GEN",
+        batch_size=2000,
+        progress=None,
+    ):
+        self.students = students
+        self.companies = companies
+        self.applications = min(applications, companies)
+        self.stage_depth = stage_depth
+        self.seed = seed
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.progress = progress
+        self.rng = random.Random(seed)
+        self.counts = {
+            "students": 0,
+            "companies": 0,
+            "placement_progress": 0,
+            "stage_progress": 0,
+        }
+
+    def run(self):
+        if Student.objects.filter(enrollment_number__startswith=self.prefix).exists():
+            raise DatasetExists(
+                f"Students with the enrollment prefix '{self.prefix}' already exist"
+            )
+
+        start = time.perf_counter()
+        self.stages = self.ensure_stages()
+        depth = len(self.stages) if self.stage_depth is None else self.stage_depth
+        self.depth = max(0, min(depth, len(self.stages)))
+        self.company_rows = self.create_companies()
+
+        for offset in range(0, self.students, self.batch_size):
+            count = min(self.batch_size, self.students - offset)
+            self.create_student_batch(offset, count)
+            if self.progress:
+                self.progress(self, time.perf_counter() - start)
+
+        # Bulk writes skipped the signals that maintain these
+        statistics.rebuild_snapshot()
+        caching.bump_version(
+            "students", "companies", "stages", "placement_progress", "stage_progress"
+        )
+        return self.counts
+
+    def ensure_stages(self):
+        stages = list(PlacementStage.objects.order_by("sequence_order", "id"))
+        if not stages:
+            stages = PlacementStage.objects.bulk_create(
+                [
+                    PlacementStage(name=name, stage_type=stage_type, sequence_order=order)
+                    for order, (name, stage_type) in enumerate(DEFAULT_STAGES, start=1)
+                ]
+            )
+        return stages
+
+    @transaction.atomic
+    def create_companies(self):
+        rng = self.rng
+        companies = []
+        for i in range(self.companies):
+            branches = rng.sample(BRANCHES, rng.randint(2, len(BRANCHES)))
+            companies.append(
+                Company(
+                    name=f"{self.prefix} Company {i + 1:05d}",
+                    description=f"Synthetic company {i + 1} hiring for {rng.choice(ROLES)}",
+                    company_type=rng.choice(COMPANY_TYPES),
+                    website=f"https://company{i + 1}.example.com",
+                    package_offered=Decimal(rng.randint(300, 4000)) / 100,
+                    min_cgpa_required=Decimal(rng.randint(600, 850)) / 100,
+                    eligible_branches=",".join(sorted(branches)),
+                    job_role=rng.choice(ROLES),
+                    job_location=rng.choice(LOCATIONS),
+                    contact_person="Campus Recruitment",
+                    contact_email=f"hr{i + 1}@company{i + 1}.example.com",
+                    contact_phone=f"9{i:09d}",
+                    is_active=rng.random() < 0.8,
+                )
+            )
+        companies = self._bulk_create(Company, companies)
+        CompanyEligibleBranch.objects.bulk_create(
+            [
+                CompanyEligibleBranch(company=company, branch=branch)
+                for company in companies
+                for branch in eligibility.parse_branches(company.eligible_branches)
+            ],
+            batch_size=self.batch_size,
+        )
+        search.index_objects(search.COMPANY, companies)
+        self.counts["companies"] = len(companies)
+        return companies
+
+    def _bulk_create(self, model, objects):
+        objects = model.objects.bulk_create(objects, batch_size=self.batch_size)
+        if objects and objects[0].pk is None:
+            raise DatasetError("The database backend does not return ids from bulk inserts")
+        return objects
+
+    def application_outcome(self):
+        """(stages reached, last stage result, status) of one application"""
+        rng = self.rng
+        reached = rng.randint(0, self.depth)
+        if reached == 0:
+            return 0, None, "APPLIED"
+        result = rng.choices(["CLEARED", "FAILED", "PENDING"], weights=[6, 3, 1])[0]
+        if result == "FAILED":
+            return reached, result, "REJECTED"
+        if result == "PENDING":
+            return reached, result, rng.choice(["IN_PROGRESS", "SHORTLISTED"])
+        if reached == len(self.stages):
+            return reached, result, rng.choice(OFFER_OUTCOMES)
+        return reached, result, "IN_PROGRESS"
+
+    @transaction.atomic
+    def create_student_batch(self, offset, count):
+        rng = self.rng
+        students = []
+        applications = []
+        for i in range(offset, offset + count):
+            student = Student(
+                enrollment_number=f"{self.prefix}{i + 1:08d}",
+                name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                email=f"{self.prefix.lower()}{i + 1}@students.example.com",
+                phone=f"8{i:09d}"[-10:],
+                branch=rng.choice(BRANCHES),
+                year=rng.choice(["3", "4"]),
+                cgpa=Decimal(rng.randint(500, 1000)) / 100,
+                skills=", ".join(rng.sample(SKILLS, rng.randint(2, 5))),
+            )
+            outcomes = [
+                (company, *self.application_outcome())
+                for company in rng.sample(self.company_rows, self.applications)
+            ]
+            student.is_placed = any(status == "OFFER_ACCEPTED" for *_, status in outcomes)
+            students.append(student)
+            applications.append(outcomes)
+
+        students = self._bulk_create(Student, students)
+
+        now = timezone.now()
+        timestamp = connection.ops.adapt_datetimefield_value(now)
+        today = connection.ops.adapt_datefield_value(timezone.localdate(now))
+        progress_rows = []
+        for student, outcomes in zip(students, applications):
+            for company, reached, _, status in outcomes:
+                current_stage = self.stages[reached - 1].pk if reached else None
+                progress_rows.append(
+                    (student.pk, company.pk, current_stage, status, today, "", timestamp, timestamp)
+                )
+        insert_rows(
+            PlacementProgress,
+            [
+                "student", "company", "current_stage", "status",
+                "application_date", "notes", "created_at", "updated_at",
+            ],
+            progress_rows,
+        )
+        progress_ids = {
+            (student_id, company_id): progress_id
+            for progress_id, student_id, company_id in PlacementProgress.objects.filter(
+                student_id__in=[student.pk for student in students]
+            ).values_list("id", "student_id", "company_id")
+        }
+
+        stage_rows = []
+        for student, outcomes in zip(students, applications):
+            for company, reached, result, _ in outcomes:
+                progress_id = progress_ids[student.pk, company.pk]
+                for position, stage in enumerate(self.stages[:reached], start=1):
+                    stage_result = result if position == reached else "CLEARED"
+                    completed = None if stage_result == "PENDING" else timestamp
+                    stage_rows.append(
+                        (progress_id, stage.pk, stage_result, "", completed, timestamp, timestamp)
+                    )
+        insert_rows(
+            StageProgress,
+            [
+                "placement_progress", "stage", "result", "feedback",
+                "completed_date", "created_at", "updated_at",
+            ],
+            stage_rows,
+        )
+
+        skills.index_students((student.pk, student.skills) for student in students)
+        search.index_objects(search.STUDENT, students)
+
+        self.counts["students"] += len(students)
+        self.counts["placement_progress"] += len(progress_rows)
+        self.counts["stage_progress"] += len(stage_rows)
@@ -0,0 +1,78 @@
+"""
+Student/company eligibility matching.
+
+`Company.eligible_branches` stays the editable comma-separated field; its
+parsed form lives in `CompanyEligibleBranch` so both directions of the
+match are a single indexed query.
+"""
+from django.core.cache import cache
+
+from . import caching
+from .models import Company, CompanyEligibleBranch, Student
+
+ELIGIBLE_COMPANIES_TIMEOUT = 60 * 60
+
+
+def parse_branches(value):
+    """Split a comma-separated branch string into unique upper-case codes"""
+    branches = []
+    for branch in (value or "").split(","):
+        branch = branch.strip().upper()
+        if branch and branch not in branches:
+            branches.append(branch)
+    return branches
+
+
+def sync_company_branches(company):
+    """Bring the company's CompanyEligibleBranch rows in line with its string field"""
+    wanted = set(parse_branches(company.eligible_branches))
+    current = set(
+        CompanyEligibleBranch.objects.filter(company=company).values_list(
+            "branch", flat=True
+        )
+    )
+    if current - wanted:
+        CompanyEligibleBranch.objects.filter(
+            company=company, branch__in=current - wanted
+        ).delete()
+    if wanted - current:
+        CompanyEligibleBranch.objects.bulk_create(
+            [
+                CompanyEligibleBranch(company=company, branch=branch)
+                for branch in sorted(wanted - current)
+            ],
+            ignore_conflicts=True,
+        )
+
+
+def eligible_students(company):
+    """Students whose branch and CGPA meet the company's criteria"""
+    return Student.objects.filter(
+        branch__in=CompanyEligibleBranch.objects.filter(company=company).values(
+            "branch"
+        ),
+        cgpa__gte=company.min_cgpa_required,
+    )
+
+
+def eligible_companies(branch, cgpa):
+    """Active companies a student of `branch` with `cgpa` can apply to"""
+    return Company.objects.filter(
+        is_active=True,
+        min_cgpa_required__lte=cgpa,
+        branch_eligibility__branch=branch,
+    )
+
+
+def cached_eligible_companies(branch, cgpa, build):
+    """
+    Cache `build(queryset)` per (branch, CGPA). CGPA is stored with two
+    decimals, so the bucket is the exact value and the result is exact.
+    """
+    versions = caching.get_versions("companies")
+    key = caching.versioned_key("eligible-companies", versions, branch, cgpa)
+    data = cache.get(key)
+    if data is None:
+        data = build(eligible_companies(branch, cgpa))
+        cache.set(key, data, ELIGIBLE_COMPANIES_TIMEOUT)
+    return data
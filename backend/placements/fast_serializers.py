@@ -0,0 +1,212 @@
+"""
+Read-only serialization of list responses straight from `.values()` rows.
+
+Instantiating model instances and running every DRF field per row dominates
+large list responses. `ValuesSerializer` derives a plan from an existing
+ModelSerializer once, then fetches only the columns that plan needs,
+resolves `get_FOO_display` sources from precomputed choice maps and loads
+nested list serializers with one extra query each. The output matches the
+ModelSerializer's field for field.
+
+Serializers with fields the plan cannot express (method fields, nested
+single objects, custom sources) are not supported; `get_values_serializer`
+returns None for them and callers fall back to the regular serializer.
+"""
+import re
+from collections import defaultdict
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.response import Response
+
+DISPLAY_SOURCE = re.compile(r"^get_(\w+)_display$")
+
+VALUE = "value"
+DISPLAY = "display"
+RELATED = "related"
+PRIMARY_KEY = "pk"
+FILE = "file"
+NESTED = "nested"
+
+
+class UnsupportedField(Exception):
+    pass
+
+
+class ValuesSerializer:
+    """Same output as `serializer_class`, built from `.values()` rows"""
+
+    def __init__(self, serializer_class, fields=None):
+        self.serializer_class = serializer_class
+        self.model = serializer_class.Meta.model
+        self.pk_column = self.model._meta.pk.attname
+        self.columns = []
+        self.plan = []
+
+        for name, field in serializer_class().fields.items():
+            if not field.write_only and (fields is None or name in fields):
+                self.plan.append(self._plan_field(name, field))
+
+    def _add_column(self, column):
+        if column not in self.columns:
+            self.columns.append(column)
+        return column
+
+    def _model_field(self, name):
+        try:
+            return self.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            raise UnsupportedField(name)
+
+    def _plan_field(self, name, field):
+        source = field.source
+        if isinstance(field, serializers.ListSerializer):
+            relation = self._model_field(source)
+            if not relation.one_to_many:
+                raise UnsupportedField(name)
+            child = ValuesSerializer(field.child.__class__)
+            child._add_column(relation.field.attname)
+            self._add_column(self.pk_column)
+            return (name, NESTED, relation, child)
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            if self._model_field(source).concrete:
+                return (name, PRIMARY_KEY, self._add_column(source), field)
+            raise UnsupportedField(name)
+        if isinstance(field, serializers.FileField):
+            model_field = self._model_field(source)
+            return (name, FILE, self._add_column(source), model_field.storage)
+
+        display = DISPLAY_SOURCE.match(source)
+        if display:
+            model_field = self._model_field(display.group(1))
+            if not model_field.choices:
+                raise UnsupportedField(name)
+            labels = {value: str(label) for value, label in model_field.flatchoices}
+            return (name, DISPLAY, self._add_column(display.group(1)), labels)
+
+        if isinstance(field, (serializers.Serializer, serializers.SerializerMethodField)):
+            raise UnsupportedField(name)
+        if len(field.source_attrs) > 1:
+            return (name, RELATED, self._add_column("__".join(field.source_attrs)), field)
+        if not getattr(self._model_field(source), "concrete", False):
+            raise UnsupportedField(name)
+        return (name, VALUE, self._add_column(source), field)
+
+    def values_queryset(self, queryset, extra_columns=()):
+        # select_related/prefetch_related are meaningless for values()
+        columns = self.columns + [c for c in extra_columns if c not in self.columns]
+        return queryset.prefetch_related(None).values(*columns)
+
+    def _load_children(self, rows, context):
+        children = {}
+        ids = [row[self.pk_column] for row in rows]
+        for name, kind, relation, child in self.plan:
+            if kind != NESTED:
+                continue
+            grouped = defaultdict(list)
+            if ids:
+                fk_column = relation.field.attname
+                queryset = relation.related_model._default_manager.filter(
+                    **{f"{relation.field.name}__in": ids}
+                )
+                child_rows = list(child.values_queryset(queryset))
+                items = child.serialize_rows(child_rows, context)
+                for child_row, item in zip(child_rows, items):
+                    grouped[child_row[fk_column]].append(item)
+            children[name] = grouped
+        return children
+
+    def serialize_rows(self, rows, context=None, nested=True):
+        """Serialize already fetched `.values()` rows, optionally without nested lists"""
+        request = (context or {}).get("request")
+        children = self._load_children(rows, context) if nested else {}
+        data = []
+        for row in rows:
+            item = {}
+            for name, kind, column, extra in self.plan:
+                if kind == NESTED:
+                    if nested:
+                        item[name] = children[name].get(row[self.pk_column], [])
+                    continue
+                value = row[column]
+                if kind == DISPLAY:
+                    item[name] = None if value is None else extra.get(value, str(value))
+                elif kind == PRIMARY_KEY:
+                    item[name] = value
+                elif kind == FILE:
+                    if not value:
+                        item[name] = None
+                    else:
+                        url = extra.url(value)
+                        item[name] = request.build_absolute_uri(url) if request else url
+                elif value is None:
+                    # DRF skips a dotted source whose relation is null
+                    if kind == RELATED and not extra.allow_null:
+                        continue
+                    item[name] = None
+                else:
+                    item[name] = extra.to_representation(value)
+            data.append(item)
+        return data
+
+    def serialize(self, queryset, context=None):
+        return self.serialize_rows(list(self.values_queryset(queryset)), context)
+
+
+@lru_cache(maxsize=128)
+def _build_values_serializer(serializer_class, fields):
+    try:
+        return ValuesSerializer(serializer_class, fields)
+    except UnsupportedField:
+        return None
+
+
+def get_values_serializer(serializer_class, fields=None):
+    """
+    Cached ValuesSerializer for `serializer_class`, limited to `fields` if
+    given, or None if the serializer is unsupported
+    """
+    return _build_values_serializer(
+        serializer_class, frozenset(fields) if fields is not None else None
+    )
+
+
+class FastListMixin:
+    """
+    Opt-in ?fast=1 list responses served from `.values()` rows. Pagination
+    works as usual; unsupported serializers fall back to the normal path.
+    """
+
+    fast_query_param = "fast"
+
+    def wants_fast_list(self):
+        value = self.request.query_params.get(self.fast_query_param, "")
+        return value.lower() in ["1", "true", "yes"]
+
+    def get_values_serializer(self):
+        serializer_class = self.get_serializer_class()
+        return get_values_serializer(
+            serializer_class, serializer_class.requested_fields(self.request)
+        )
+
+    def list(self, request, *args, **kwargs):
+        values_serializer = self.get_values_serializer() if self.wants_fast_list() else None
+        if values_serializer is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        # Keyset cursors read their position from the ordering columns
+        ordering = ()
+        if hasattr(self.paginator, "get_ordering"):
+            ordering = self.paginator.get_ordering(request, queryset, self)
+        queryset = values_serializer.values_queryset(
+            queryset, [field.lstrip("-") for field in ordering]
+        )
+        context = self.get_serializer_context()
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(
+                values_serializer.serialize_rows(list(page), context)
+            )
+        return Response(values_serializer.serialize_rows(list(queryset), context))
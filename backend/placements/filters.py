@@ -0,0 +1,74 @@
+from decimal import Decimal, InvalidOperation
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+from .skills import filter_by_skills
+
+TRUE_VALUES = ["1", "true", "yes"]
+FALSE_VALUES = ["0", "false", "no"]
+
+
+class SkillsFilterBackend(BaseFilterBackend):
+    """
+    Filter students by skill through the skills index.
+    ?skills=python,sql matches students with every listed skill;
+    add ?skills_match=any to match students with at least one.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        skills = request.query_params.get("skills")
+        if not skills:
+            return queryset
+        match_all = request.query_params.get("skills_match", "all").lower() != "any"
+        return filter_by_skills(queryset, skills.split(","), match_all=match_all)
+
+
+def _split(value):
+    return [item.strip().upper() for item in value.split(",") if item.strip()]
+
+
+class StudentFilterBackend(BaseFilterBackend):
+    """
+    Filter students on indexed columns:
+    ?branch=CSE,IT  ?year=3,4  ?cgpa__gte=7.5  ?cgpa__lte=9  ?is_placed=true
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        if params.get("branch"):
+            queryset = queryset.filter(branch__in=_split(params["branch"]))
+        if params.get("year"):
+            queryset = queryset.filter(year__in=_split(params["year"]))
+        for lookup in ["cgpa__gte", "cgpa__lte"]:
+            if params.get(lookup):
+                try:
+                    value = Decimal(params[lookup])
+                except InvalidOperation:
+                    raise ValidationError({lookup: "Must be a number."})
+                if not value.is_finite() or not Decimal("0") <= value <= Decimal("10"):
+                    raise ValidationError({lookup: "Must be between 0 and 10."})
+                queryset = queryset.filter(**{lookup: value})
+        is_placed = params.get("is_placed", "").lower()
+        if is_placed in TRUE_VALUES:
+            queryset = queryset.filter(is_placed=True)
+        elif is_placed in FALSE_VALUES:
+            queryset = queryset.filter(is_placed=False)
+        return queryset
+
+
+class StableOrderingFilter(OrderingFilter):
+    """
+    OrderingFilter that ends every ordering with the primary key in the same
+    direction as the last field, so equal values page deterministically and
+    keyset cursors stay unique
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        ordering = list(ordering)
+        if not any(field.lstrip("-") in ("id", "pk") for field in ordering):
+            ordering.append("-id" if ordering[-1].startswith("-") else "id")
+        return ordering
@@ -0,0 +1,86 @@
+"""
+Per-company stage funnels: how many applicants reached, cleared and
+failed each placement stage, in `sequence_order`.
+
+All stage counts come from one grouped query over StageProgress; a second
+grouped query counts the applications each funnel starts from.
+"""
+from django.db.models import Count, Q
+
+from .models import PlacementProgress, StageProgress
+
+SELECTED_STATUSES = ["SELECTED", "OFFER_RECEIVED", "OFFER_ACCEPTED", "OFFER_DECLINED"]
+
+
+def _rate(part, whole):
+    return round(part / whole * 100, 2) if whole else 0
+
+
+def compute_funnels(company_id=None):
+    """Funnel of every company with applications, or only of `company_id`"""
+    applications = PlacementProgress.objects.order_by()
+    stage_rows = StageProgress.objects.order_by()
+    if company_id is not None:
+        applications = applications.filter(company_id=company_id)
+        stage_rows = stage_rows.filter(placement_progress__company_id=company_id)
+
+    funnels = {}
+    application_rows = applications.values("company_id", "company__name").annotate(
+        applications=Count("id"),
+        selected=Count("id", filter=Q(status__in=SELECTED_STATUSES)),
+    )
+    for row in application_rows.order_by("company__name", "company_id"):
+        funnels[row["company_id"]] = {
+            "company": row["company_id"],
+            "company_name": row["company__name"],
+            "applications": row["applications"],
+            "selected": row["selected"],
+            "selection_rate": _rate(row["selected"], row["applications"]),
+            "stages": [],
+        }
+
+    stage_rows = stage_rows.values(
+        "placement_progress__company_id",
+        "stage_id",
+        "stage__name",
+        "stage__sequence_order",
+    ).annotate(
+        reached=Count("id"),
+        cleared=Count("id", filter=Q(result="CLEARED")),
+        failed=Count("id", filter=Q(result="FAILED")),
+        pending=Count("id", filter=Q(result="PENDING")),
+    )
+    for row in stage_rows.order_by("stage__sequence_order", "stage_id"):
+        funnel = funnels.get(row["placement_progress__company_id"])
+        if funnel is None:
+            continue
+        funnel["stages"].append(
+            {
+                "stage": row["stage_id"],
+                "name": row["stage__name"],
+                "sequence_order": row["stage__sequence_order"],
+                "reached": row["reached"],
+                "cleared": row["cleared"],
+                "failed": row["failed"],
+                "pending": row["pending"],
+                # Of those who reached this stage / of all applicants
+                "clear_rate": _rate(row["cleared"], row["reached"]),
+                "overall_rate": _rate(row["cleared"], funnel["applications"]),
+            }
+        )
+    return list(funnels.values())
+
+
+def get_funnel(company):
+    """Funnel of one company; an empty one if nobody has applied yet"""
+    funnels = compute_funnels(company.pk)
+    if funnels:
+        return funnels[0]
+    return {
+        "company": company.pk,
+        "company_name": company.name,
+        "applications": 0,
+        "selected": 0,
+        "selection_rate": 0,
+        "stages": [],
+    }
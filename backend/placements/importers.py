@@ -0,0 +1,164 @@
+"""
+Streaming, batched import of students from CSV uploads.
+"""
+import codecs
+import csv
+from decimal import Decimal, InvalidOperation
+
+from django.db import IntegrityError, transaction
+
+from . import caching, search, skills, statistics
+from .models import Student
+
+DEFAULT_BATCH_SIZE = 500
+
+# Columns written on every upsert; created_at is only set on insert
+UPSERT_FIELDS = [
+    "name",
+    "email",
+    "phone",
+    "branch",
+    "year",
+    "cgpa",
+    "skills",
+    "is_placed",
+    "updated_at",
+]
+
+
+class StudentCSVImporter:
+    """
+    Parse a students CSV incrementally and upsert it in chunks.
+
+    Each chunk is written with a single `bulk_create(update_conflicts=True)`
+    keyed on `enrollment_number`. If a chunk violates another constraint
+    (for example a duplicate email) it is replayed row by row so the error
+    can be attributed to the offending row, as the old importer did.
+    """
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, progress=None):
+        self.batch_size = batch_size
+        self.progress = progress
+        self.created = 0
+        self.updated = 0
+        self.processed = 0
+        self.errors = []
+
+    def run(self, lines):
+        """Import from an iterable of encoded CSV lines, e.g. an UploadedFile"""
+        reader = csv.DictReader(codecs.iterdecode(lines, "utf-8-sig"))
+
+        batch = []
+        try:
+            for row_num, row in enumerate(reader, start=2):  # Header is row 1
+                self.processed += 1
+                values = self.parse_row(row_num, row)
+                if values is not None:
+                    batch.append((row_num, values))
+                if len(batch) >= self.batch_size:
+                    self.write_batch(batch)
+                    batch = []
+            if batch:
+                self.write_batch(batch)
+        finally:
+            # Batches written before a decoding error stay committed, so the
+            # snapshot must follow them either way
+            if self.created or self.updated:
+                # bulk_create bypasses the signals that maintain the snapshot
+                statistics.rebuild_snapshot()
+                caching.bump_version("students")
+        return self.report()
+
+    def report(self):
+        return {
+            "created": self.created,
+            "updated": self.updated,
+            "errors": [
+                f"Row {row_num}: {message}" for row_num, message in sorted(self.errors)
+            ],
+        }
+
+    def parse_row(self, row_num, row):
+        def value(column):
+            return (row.get(column) or "").strip()
+
+        enrollment_number = value("enrollment_number")
+        if not enrollment_number:
+            self.errors.append((row_num, "Missing enrollment_number"))
+            return None
+
+        try:
+            cgpa = Decimal(value("cgpa") or "0")
+        except InvalidOperation:
+            self.errors.append((row_num, f"Invalid cgpa '{value('cgpa')}'"))
+            return None
+        if not cgpa.is_finite() or not Decimal("0") <= cgpa <= Decimal("10"):
+            self.errors.append((row_num, "cgpa must be between 0 and 10"))
+            return None
+
+        return {
+            "enrollment_number": enrollment_number,
+            "name": value("name"),
+            "email": value("email"),
+            "phone": value("phone"),
+            "branch": value("branch"),
+            "year": value("year"),
+            "cgpa": cgpa.quantize(Decimal("0.01")),
+            "skills": value("skills"),
+            "is_placed": (value("is_placed") or "FALSE").upper() == "TRUE",
+        }
+
+    def write_batch(self, batch):
+        enrollment_numbers = {values["enrollment_number"] for _, values in batch}
+        existing = set(
+            Student.objects.filter(enrollment_number__in=enrollment_numbers).values_list(
+                "enrollment_number", flat=True
+            )
+        )
+
+        # Later rows for the same enrollment number win, like sequential upserts
+        students = {}
+        created = updated = 0
+        for _, values in batch:
+            enrollment_number = values["enrollment_number"]
+            if enrollment_number in existing or enrollment_number in students:
+                updated += 1
+            else:
+                created += 1
+            students[enrollment_number] = Student(**values)
+
+        try:
+            with transaction.atomic():
+                Student.objects.bulk_create(
+                    list(students.values()),
+                    update_conflicts=True,
+                    unique_fields=["enrollment_number"],
+                    update_fields=UPSERT_FIELDS,
+                )
+                written = Student.objects.filter(enrollment_number__in=list(students))
+                skills.index_students(written.values_list("id", "skills"))
+                search.index_objects(search.STUDENT, written)
+        except IntegrityError:
+            self.write_rows(batch)
+        else:
+            self.created += created
+            self.updated += updated
+
+        if self.progress:
+            self.progress(self)
+
+    def write_rows(self, batch):
+        for row_num, values in batch:
+            enrollment_number = values.pop("enrollment_number")
+            try:
+                with transaction.atomic():
+                    _, created = Student.objects.update_or_create(
+                        enrollment_number=enrollment_number, defaults=values
+                    )
+            except Exception as e:
+                self.errors.append((row_num, str(e)))
+                continue
+            if created:
+                self.created += 1
+            else:
+                self.updated += 1
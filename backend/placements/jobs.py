@@ -0,0 +1,154 @@
+"""
+Database-backed background jobs for student CSV imports and bulk user
+account creation.
+
+Jobs are stored as `StudentImportJob` rows and picked up by the
+`process_import_jobs` management command, so no broker is needed.
+"""
+import io
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .importers import StudentCSVImporter
+from .models import Student, StudentImportJob
+from .provisioning import AccountProvisioner
+
+# Running jobs without progress for this long are assumed to belong to a dead worker
+STALE_JOB_TIMEOUT = timedelta(minutes=30)
+
+
+def enqueue_student_import(csv_file, user=None):
+    """Store an uploaded CSV as a pending import job"""
+    payload = b"".join(csv_file.chunks())
+    lines = payload.count(b"\n")
+    if payload and not payload.endswith(b"\n"):
+        lines += 1
+    return StudentImportJob.objects.create(
+        file_name=csv_file.name,
+        payload=payload,
+        created_by=user,
+        total_rows=max(lines - 1, 0),  # Minus the header
+    )
+
+
+def enqueue_account_provisioning(student_ids, user=None):
+    """Queue user account creation for the given students"""
+    student_ids = sorted(student_ids)
+    return StudentImportJob.objects.create(
+        kind="ACCOUNTS",
+        file_name=f"User accounts for {len(student_ids)} students",
+        payload=",".join(map(str, student_ids)).encode("ascii"),
+        created_by=user,
+        total_rows=len(student_ids),
+    )
+
+
+def claim_next_job():
+    """
+    Mark the oldest pending job as running and return it. The conditional
+    UPDATE makes the claim safe with several workers on any database.
+    """
+    while True:
+        job_id = (
+            StudentImportJob.objects.filter(status="PENDING")
+            .order_by("created_at")
+            .values_list("id", flat=True)
+            .first()
+        )
+        if job_id is None:
+            return None
+        claimed = StudentImportJob.objects.filter(pk=job_id, status="PENDING").update(
+            status="RUNNING", started_at=timezone.now(), updated_at=timezone.now()
+        )
+        if claimed:
+            return StudentImportJob.objects.get(pk=job_id)
+
+
+def requeue_stale_jobs(older_than):
+    """
+    Return jobs left running by a worker that died to the queue. Running
+    jobs touch updated_at after every chunk, so only silent ones qualify.
+    """
+    cutoff = timezone.now() - older_than
+    return StudentImportJob.objects.filter(
+        status="RUNNING", updated_at__lt=cutoff
+    ).update(status="PENDING", started_at=None, updated_at=timezone.now())
+
+
+def run_job(job, batch_size=None):
+    """Import the job's CSV, recording progress after every chunk"""
+    if job.kind == "ACCOUNTS":
+        return run_account_job(job, batch_size)
+
+    def record_progress(importer):
+        StudentImportJob.objects.filter(pk=job.pk).update(
+            processed_rows=importer.processed,
+            created_count=importer.created,
+            updated_count=importer.updated,
+            updated_at=timezone.now(),
+        )
+
+    options = {"progress": record_progress}
+    if batch_size:
+        options["batch_size"] = batch_size
+    importer = StudentCSVImporter(**options)
+
+    try:
+        report = importer.run(io.BytesIO(bytes(job.payload)))
+    except Exception as e:
+        job.status = "FAILED"
+        job.error_message = str(e)
+        report = importer.report()
+    else:
+        job.status = "COMPLETED"
+
+    job.processed_rows = importer.processed
+    job.created_count = report["created"]
+    job.updated_count = report["updated"]
+    job.errors = report["errors"]
+    job.payload = b""
+    job.finished_at = timezone.now()
+    job.save()
+    return job
+
+
+def run_account_job(job, batch_size=None):
+    """
+    Link or create accounts for the job's students. Created accounts count
+    as created rows, links to existing users as updated rows.
+    """
+    student_ids = [int(pk) for pk in bytes(job.payload).decode("ascii").split(",") if pk]
+
+    def record_progress(provisioner):
+        StudentImportJob.objects.filter(pk=job.pk).update(
+            processed_rows=len(provisioner.report["linked"]) + len(provisioner.report["created"]),
+            created_count=len(provisioner.report["created"]),
+            updated_count=len(provisioner.report["linked"]),
+            updated_at=timezone.now(),
+        )
+
+    options = {"progress": record_progress}
+    if batch_size:
+        options["batch_size"] = batch_size
+    provisioner = AccountProvisioner(**options)
+
+    try:
+        provisioner.run(Student.objects.filter(pk__in=student_ids, user__isnull=True))
+    except Exception as e:
+        job.status = "FAILED"
+        job.error_message = str(e)
+    else:
+        job.status = "COMPLETED"
+
+    report = provisioner.report
+    job.created_count = len(report["created"])
+    job.updated_count = len(report["linked"])
+    job.processed_rows = job.created_count + job.updated_count + len(report["skipped"])
+    job.errors = [
+        f"{student.enrollment_number}: {reason}" for student, reason in report["skipped"]
+    ]
+    job.payload = b""
+    job.finished_at = timezone.now()
+    job.save()
+    return job
@@ -0,0 +1,94 @@
+import io
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from placements.importers import StudentCSVImporter
+from placements.models import Student
+
+HEADER = 'enrollment_number,name,email,phone,branch,year,cgpa,skills,is_placed\n'
+BRANCHES = ['CSE', 'IT', 'ECE', 'ME', 'CE', 'EE']
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the streaming student CSV importer (all writes are rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            default='1000,10000,100000',
+            help='Comma-separated row counts to import (default: 1000,10000,100000)',
+        )
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument(
+            '--legacy',
+            action='store_true',
+            help='Also time the previous one-update_or_create-per-row import',
+        )
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',') if size.strip()]
+
+        for size in sizes:
+            payload = self.build_csv(size)
+
+            # Fresh insert, then the same file again as a pure update
+            insert_time, insert_report = self.time_import(payload, options['batch_size'], rerun=False)
+            update_time, update_report = self.time_import(payload, options['batch_size'], rerun=True)
+            self.report(size, 'streaming insert', insert_time, insert_report)
+            self.report(size, 'streaming update', update_time, update_report)
+
+            if options['legacy']:
+                legacy_time = self.time_legacy(payload)
+                self.report(size, 'legacy insert', legacy_time, None)
+
+    def build_csv(self, size):
+        lines = [HEADER]
+        for i in range(size):
+            lines.append(
+                f"BENCH{i:07d},Bench Student {i},bench{i}@example.com,98765{i % 100000:05d},"
+                f"{BRANCHES[i % len(BRANCHES)]},{i % 4 + 1},{6 + (i % 400) / 100:.2f},"
+                f"\"Python, SQL\",{'TRUE' if i % 3 == 0 else 'FALSE'}\n"
+            )
+        return ''.join(lines).encode('utf-8')
+
+    def time_import(self, payload, batch_size, rerun):
+        with transaction.atomic():
+            if rerun:
+                StudentCSVImporter(batch_size=batch_size).run(io.BytesIO(payload))
+            start = time.perf_counter()
+            report = StudentCSVImporter(batch_size=batch_size).run(io.BytesIO(payload))
+            elapsed = time.perf_counter() - start
+            transaction.set_rollback(True)
+        return elapsed, report
+
+    def time_legacy(self, payload):
+        import csv
+
+        with transaction.atomic():
+            start = time.perf_counter()
+            reader = csv.DictReader(io.StringIO(payload.decode('utf-8')))
+            for row in reader:
+                Student.objects.update_or_create(
+                    enrollment_number=row['enrollment_number'],
+                    defaults={
+                        'name': row['name'],
+                        'email': row['email'],
+                        'phone': row['phone'],
+                        'branch': row['branch'],
+                        'year': row['year'],
+                        'cgpa': float(row['cgpa']),
+                        'skills': row['skills'],
+                        'is_placed': row['is_placed'] == 'TRUE',
+                    },
+                )
+            elapsed = time.perf_counter() - start
+            transaction.set_rollback(True)
+        return elapsed
+
+    def report(self, size, label, elapsed, report):
+        rate = size / elapsed if elapsed else 0
+        line = f"{size:>8} rows  {label:<17} {elapsed:8.2f}s  {rate:10.0f} rows/s"
+        if report is not None:
+            line += f"  created={report['created']} updated={report['updated']} errors={len(report['errors'])}"
+        self.stdout.write(line)
@@ -0,0 +1,187 @@
+import json
+import platform
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.runner import DiscoverRunner
+from placements.benchmarks import (
+    ENDPOINTS,
+    MIN_COMPARE_REPEAT,
+    case_key,
+    client_for,
+    compare,
+    run_case,
+)
+from placements.datasets import DatasetGenerator
+from placements.models import Student
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark the key API endpoints per role against generated datasets in a '
+        'throwaway test database, and fail on regressions against a baseline file'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            default='1000,10000',
+            help='Comma-separated student counts to generate (default: 1000,10000)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help=(
+                f'Timed requests per endpoint and role (default: 20; at least '
+                f'{MIN_COMPARE_REPEAT} when comparing)'
+            ),
+        )
+        parser.add_argument(
+            '--only',
+            action='append',
+            choices=sorted(ENDPOINTS),
+            help='Benchmark only this endpoint; may be given more than once',
+        )
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument(
+            '--baseline',
+            default=str(Path(settings.BASE_DIR) / 'benchmark_baseline.json'),
+            help='Baseline file to compare against or record (default: benchmark_baseline.json)',
+        )
+        parser.add_argument(
+            '--record',
+            action='store_true',
+            help='Write the results to the baseline file instead of comparing',
+        )
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=0.25,
+            help='Allowed p50/p95 latency growth as a fraction (default: 0.25)',
+        )
+        parser.add_argument(
+            '--memory-threshold',
+            type=float,
+            default=0.25,
+            help='Allowed peak memory growth as a fraction (default: 0.25)',
+        )
+        parser.add_argument(
+            '--extra-queries',
+            type=int,
+            default=0,
+            help='Queries a request may add over the baseline (default: 0)',
+        )
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',') if size.strip()]
+        endpoints = options['only'] or sorted(ENDPOINTS)
+        path = Path(options['baseline'])
+        if not options['record'] and not path.exists():
+            raise CommandError(f'No baseline at {path}; run with --record to create one')
+        if not options['record'] and options['repeat'] < MIN_COMPARE_REPEAT:
+            raise CommandError(
+                f'--repeat must be at least {MIN_COMPARE_REPEAT} to compare latency percentiles'
+            )
+        if 'dashboard' in endpoints:
+            self.stdout.write(
+                self.style.WARNING(
+                    'Note: queries and peak memory are profiled inside a transaction, where the '
+                    'dashboard builds its panels serially; its latencies use the concurrent '
+                    'thread pool path'
+                )
+            )
+
+        runner = DiscoverRunner(verbosity=0, interactive=False)
+        runner.setup_test_environment()
+        old_config = runner.setup_databases()
+        try:
+            results = {}
+            for size in sizes:
+                results.update(self.benchmark_size(size, endpoints, options))
+            environment = {
+                'database': connection.vendor,
+                'host': platform.node(),
+                'python': platform.python_version(),
+                'repeat': options['repeat'],
+                'notes': 'dashboard queries and peak memory are profiled with serial panels',
+            }
+        finally:
+            runner.teardown_databases(old_config)
+            runner.teardown_test_environment()
+
+        if options['record']:
+            path.write_text(json.dumps({'environment': environment, 'results': results}, indent=2) + '\n')
+            self.stdout.write(self.style.SUCCESS(f'Recorded {len(results)} cases in {path}'))
+            return
+
+        baseline = json.loads(path.read_text())
+        if baseline.get('environment', {}).get('database') != environment['database']:
+            self.stdout.write(
+                self.style.WARNING('Baseline was recorded on another database backend')
+            )
+        # Latencies are wall-clock numbers of the machine that recorded them
+        same_host = baseline.get('environment', {}).get('host') == environment['host']
+        if not same_host:
+            self.stdout.write(
+                self.style.WARNING(
+                    'Baseline was recorded on another host; comparing queries and memory only. '
+                    'Re-record it with --record on this host to compare latencies'
+                )
+            )
+        regressions = compare(
+            results,
+            baseline.get('results', {}),
+            threshold=options['threshold'],
+            memory_threshold=options['memory_threshold'],
+            extra_queries=options['extra_queries'],
+            latency=same_host,
+        )
+        if regressions:
+            for regression in regressions:
+                self.stdout.write(self.style.ERROR(regression))
+            raise CommandError(f'{len(regressions)} regression(s) against {path}')
+        self.stdout.write(self.style.SUCCESS(f'No regressions against {path}'))
+
+    def benchmark_size(self, size, endpoints, options):
+        call_command('flush', interactive=False, verbosity=0)
+        cache.clear()
+        DatasetGenerator(
+            students=size,
+            companies=max(20, size // 200),
+            applications=5,
+            seed=options['seed'],
+            prefix='BENCH',
+        ).run()
+
+        admin = User.objects.create_user('bench-admin', 'bench-admin@example.com', role='ADMIN')
+        student = Student.objects.order_by('id').first()
+        student.user = User.objects.create_user(
+            student.enrollment_number, student.email, role='STUDENT'
+        )
+        student.save(update_fields=['user'])
+        clients = {'admin': client_for(admin), 'student': client_for(student.user)}
+
+        results = {}
+        for endpoint in endpoints:
+            request, roles = ENDPOINTS[endpoint]
+            for role in roles:
+                key = case_key(size, endpoint, role)
+                try:
+                    result = run_case(request, clients[role], options['repeat'])
+                except RuntimeError as e:
+                    raise CommandError(f'{key}: {e}')
+                results[key] = result
+                self.stdout.write(
+                    f"{key:<40} p50 {result['p50_ms']:8.1f}ms  p95 {result['p95_ms']:8.1f}ms  "
+                    f"p99 {result['p99_ms']:8.1f}ms  {result['queries']:>4} queries  "
+                    f"{result['peak_memory_kb']:>9.1f}KB peak"
+                )
+        return results
@@ -0,0 +1,84 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from placements.fast_serializers import get_values_serializer
+from placements.models import PlacementProgress, Student
+from placements.serializers import PlacementProgressSerializer, StudentSerializer
+from rest_framework.renderers import JSONRenderer
+
+TARGETS = {
+    'students': (Student, StudentSerializer),
+    'placement_progress': (PlacementProgress, PlacementProgressSerializer),
+}
+
+
+class Command(BaseCommand):
+    help = 'Compare ModelSerializer and ?fast=1 values-based serialization throughput'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=500,
+            help='Rows serialized per run (default: 500)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Runs per serializer; the fastest one is reported (default: 5)',
+        )
+        parser.add_argument(
+            '--only',
+            choices=sorted(TARGETS),
+            help='Benchmark a single list instead of all of them',
+        )
+
+    def handle(self, *args, **options):
+        names = [options['only']] if options['only'] else sorted(TARGETS)
+        for name in names:
+            model, serializer_class = TARGETS[name]
+            queryset = model.objects.order_by('-id')[:options['limit']]
+            ids = list(queryset.values_list('id', flat=True))
+            if not ids:
+                self.stdout.write(f'{name}: no rows to serialize, skipped')
+                continue
+            queryset = model.objects.filter(id__in=ids).order_by('-id')
+            values_serializer = get_values_serializer(serializer_class)
+
+            def drf():
+                return serializer_class(
+                    serializer_class.setup_eager_loading(queryset), many=True
+                ).data
+
+            def fast():
+                return values_serializer.serialize(queryset)
+
+            drf_time, drf_data = self.best_of(drf, options['repeat'])
+            fast_time, fast_data = self.best_of(fast, options['repeat'])
+            identical = self.render(drf_data) == self.render(fast_data)
+
+            self.report(name, 'ModelSerializer', len(ids), drf_time)
+            self.report(name, 'values', len(ids), fast_time)
+            speedup = drf_time / fast_time if fast_time else 0
+            style = self.style.SUCCESS if identical else self.style.ERROR
+            self.stdout.write(
+                style(f'{name}: {speedup:.1f}x faster, identical output: {"yes" if identical else "NO"}')
+            )
+
+    def best_of(self, serialize, repeat):
+        best, data = None, None
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            data = serialize()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, data
+
+    def render(self, data):
+        return json.loads(JSONRenderer().render(data))
+
+    def report(self, name, label, rows, elapsed):
+        rate = rows / elapsed if elapsed else 0
+        self.stdout.write(f'{name:<20} {label:<16} {rows:>7} rows {elapsed:8.3f}s {rate:10.0f} rows/s')
@@ -0,0 +1,111 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from placements.statistics import placed_by_branch
+from placements.views import (
+    CompanyViewSet,
+    ImportantDateViewSet,
+    PlacementProgressViewSet,
+    StudentViewSet,
+)
+from rest_framework.settings import api_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+User = get_user_model()
+
+
+def get_view(viewset, path, action='list'):
+    """`viewset` set up as for an admin's GET of `path`, without running it"""
+    request = APIRequestFactory().get(path)
+    # Never saved: admins see everything, so no lookup touches the database
+    force_authenticate(request, User(username='query-plans', role='ADMIN'))
+    view = viewset(action_map={'get': action}, args=(), kwargs={}, format_kwarg=None)
+    view.request = view.initialize_request(request)
+    return view
+
+
+def list_page(viewset, path):
+    """The first page of the queryset `viewset` lists for `path`"""
+    view = get_view(viewset, path)
+    return view.filter_queryset(view.get_queryset())[:api_settings.PAGE_SIZE]
+
+
+def hot_querysets():
+    """The querysets behind the busiest list endpoints and filters, as the views build them"""
+    recent = get_view(
+        PlacementProgressViewSet, '/api/placement-progress/recent_updates/', 'recent_updates'
+    )
+    upcoming = get_view(ImportantDateViewSet, '/api/important-dates/upcoming/', 'upcoming')
+    active = get_view(CompanyViewSet, '/api/companies/active_companies/', 'active_companies')
+    return [
+        (
+            'placement progress list',
+            list_page(PlacementProgressViewSet, '/api/placement-progress/'),
+        ),
+        ('recent placement progress', recent.eager_load(recent.get_recent_queryset())[:10]),
+        (
+            'placed students by branch',
+            list_page(StudentViewSet, '/api/students/?branch=CSE&is_placed=true'),
+        ),
+        ('branch-wise placement counts', placed_by_branch()),
+        (
+            'unplaced students by branch',
+            list_page(StudentViewSet, '/api/students/?branch=CSE&is_placed=false'),
+        ),
+        (
+            'eligible students',
+            list_page(StudentViewSet, '/api/students/?branch=CSE&cgpa__gte=7'),
+        ),
+        ('student list', list_page(StudentViewSet, '/api/students/')),
+        (
+            'upcoming important dates',
+            upcoming.get_upcoming_queryset().order_by('event_date')[:10],
+        ),
+        ('active companies', active.eager_load(active.get_active_queryset())),
+    ]
+
+
+def plan_problems(plan):
+    """
+    Full table scans, and sorts of a whole table that an index should have
+    provided. Sorting the rows an index search already narrowed is fine.
+    """
+    details = [
+        line.split(' ', 3)[-1] if line[:1].isdigit() else line
+        for line in plan.splitlines()
+    ]
+    searched = any(detail.startswith('SEARCH ') for detail in details)
+    problems = []
+    for detail in details:
+        if detail.startswith('SCAN ') and ' USING ' not in detail:
+            problems.append(f"full table scan: {detail}")
+        elif 'USE TEMP B-TREE FOR ORDER BY' in detail and not searched:
+            problems.append(f"sort without index: {detail}")
+    return problems
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN the hot querysets and fail if one falls back to a full scan (SQLite)'
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError(
+                f"Query plan checks are written against SQLite plans, not {connection.vendor}"
+            )
+
+        failures = 0
+        for name, queryset in hot_querysets():
+            plan = queryset.explain()
+            problems = plan_problems(plan)
+            if problems:
+                failures += 1
+                self.stdout.write(self.style.ERROR(f"✗ {name}"))
+                for problem in problems:
+                    self.stdout.write(f"    {problem}")
+            else:
+                self.stdout.write(self.style.SUCCESS(f"✓ {name}"))
+            if options['verbosity'] > 1:
+                self.stdout.write('    ' + plan.replace('\n', '\n    '))
+
+        if failures:
+            raise CommandError(f"{failures} hot querysets do not use an index")
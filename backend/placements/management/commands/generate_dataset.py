@@ -0,0 +1,66 @@
+from django.core.management.base import BaseCommand, CommandError
+from placements.datasets import DatasetError, DatasetExists, DatasetGenerator
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate a deterministic synthetic dataset with bulk inserts for load testing. '
+        'Students get no user accounts; run link_student_users afterwards if needed.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=1000)
+        parser.add_argument('--companies', type=int, default=50)
+        parser.add_argument(
+            '--applications',
+            type=int,
+            default=10,
+            help='Applications per student, capped at --companies (default: 10)',
+        )
+        parser.add_argument(
+            '--stage-depth',
+            type=int,
+            help='Most stages an application advances through (default: all stages)',
+        )
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument(
+            '--prefix',
+            default='GEN',
+            help='Tag for enrollment numbers, emails and company names (default: GEN)',
+        )
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        generator = DatasetGenerator(
+            students=options['students'],
+            companies=options['companies'],
+            applications=options['applications'],
+            stage_depth=options['stage_depth'],
+            seed=options['seed'],
+            prefix=options['prefix'],
+            batch_size=options['batch_size'],
+            progress=self.report_progress,
+        )
+        try:
+            counts = generator.run()
+        except DatasetExists as e:
+            raise CommandError(f'{e}; use another --prefix or a fresh database')
+        except DatasetError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {counts['students']} students, {counts['companies']} companies, "
+                f"{counts['placement_progress']} placement progress and "
+                f"{counts['stage_progress']} stage progress rows"
+            )
+        )
+
+    def report_progress(self, generator, elapsed):
+        done = generator.counts['students']
+        rate = done / elapsed if elapsed else 0
+        self.stdout.write(
+            f"{done}/{generator.students} students, "
+            f"{generator.counts['placement_progress']} applications "
+            f"({elapsed:.1f}s, {rate:.0f} students/s)"
+        )
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from placements import search
+from placements.models import SearchEntry
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index over students, companies and important dates'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        for kind, (model, _) in search.DOCUMENTS.items():
+            indexed = 0
+            batch = []
+            for obj in model.objects.order_by('id').iterator(chunk_size=batch_size):
+                batch.append(obj)
+                if len(batch) >= batch_size:
+                    indexed += self.index_batch(kind, batch)
+                    batch = []
+            if batch:
+                indexed += self.index_batch(kind, batch)
+
+            # Drop entries whose objects were deleted while signals were bypassed
+            stale = SearchEntry.objects.filter(kind=kind).exclude(
+                object_id__in=model.objects.values('id')
+            )
+            removed, _ = stale.delete()
+            self.stdout.write(f'{kind}: indexed {indexed}, removed {removed} stale entries')
+
+        search.rebuild_fts_index()
+        self.stdout.write(self.style.SUCCESS('Search index rebuilt'))
+
+    @transaction.atomic
+    def index_batch(self, kind, batch):
+        return search.index_objects(kind, batch)
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from placements.models import Student
+from placements.skills import index_students
+
+
+class Command(BaseCommand):
+    help = 'Tokenize Student.skills into the normalized skills index'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        students = Student.objects.order_by('id').values_list('id', 'skills')
+
+        indexed = 0
+        links = 0
+        batch = []
+        for row in students.iterator(chunk_size=batch_size):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                links += self.index_batch(batch)
+                indexed += len(batch)
+                batch = []
+        if batch:
+            links += self.index_batch(batch)
+            indexed += len(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed skills for {indexed} students ({links} links)")
+        )
+
+    @transaction.atomic
+    def index_batch(self, batch):
+        return index_students(batch)
@@ -1,59 +1,84 @@
-from django.core.management.base import BaseCommand
-from django.contrib.auth import get_user_model
-from placements.models import Student
+import time
 
-User = get_user_model()
+from django.core.management.base import BaseCommand, CommandError
+from placements.models import Student
+from placements.provisioning import AccountProvisioner, ProvisioningError
 
 
 class Command(BaseCommand):
     help = 'Link existing students to user accounts or create new user accounts'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--link-only',
+            action='store_true',
+            help='Only link students to matching existing users, do not create accounts',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would be linked and created without writing anything',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Processes hashing passwords (default: PASSWORD_HASH_WORKERS, or one per CPU)',
+        )
+        parser.add_argument('--batch-size', type=int, default=500)
+
     def handle(self, *args, **options):
-        students_without_users = Student.objects.filter(user__isnull=True)
-        
-        self.stdout.write(f"Found {students_without_users.count()} students without linked user accounts")
-        
-        created_count = 0
-        linked_count = 0
+        students_without_users = list(Student.objects.filter(user__isnull=True))
         
-        for student in students_without_users:
-            username = student.enrollment_number.lower()
-            
-            # Check if user already exists
-            existing_user = User.objects.filter(username=username).first()
-            if existing_user:
-                # Link existing user
-                student.user = existing_user
-                student.save()
-                linked_count += 1
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Linked student {student.enrollment_number} to existing user {username}"
-                    )
-                )
-            else:
-                # Create new user account
-                password = f"{student.name.split()[0].lower()}{student.enrollment_number[-4:]}"
-                user = User.objects.create_user(
-                    username=username,
-                    email=student.email,
-                    password=password,
-                    first_name=student.name.split()[0] if student.name else '',
-                    last_name=' '.join(student.name.split()[1:]) if len(student.name.split()) > 1 else '',
-                    role='STUDENT',
-                    phone=student.phone
+        self.stdout.write(f"Found {len(students_without_users)} students without linked user accounts")
+
+        self.started = time.perf_counter()
+        provisioner = AccountProvisioner(
+            workers=options['workers'],
+            batch_size=options['batch_size'],
+            dry_run=options['dry_run'],
+            link_only=options['link_only'],
+            progress=self.report_progress,
+        )
+        try:
+            report = provisioner.run(students_without_users)
+        except ProvisioningError as e:
+            raise CommandError(str(e))
+
+        prefix = '[dry run] Would link' if options['dry_run'] else 'Linked'
+        for student in report['linked']:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{prefix} student {student.enrollment_number} to existing user {student.user.username}"
                 )
-                student.user = user
-                student.save()
-                created_count += 1
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Created user for {student.enrollment_number}: {username} / {password}"
-                    )
+            )
+        for student, reason in report['skipped']:
+            self.stdout.write(self.style.WARNING(f"Skipped {student.enrollment_number}: {reason}"))
+        prefix = '[dry run] Would create' if options['dry_run'] else 'Created'
+        for student, password in report['created']:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{prefix} user for {student.enrollment_number}: "
+                    f"{student.enrollment_number.lower()} / {password}"
                 )
-        
-        self.stdout.write(
-            self.style.SUCCESS(
-                f"\nCompleted! Created {created_count} users, linked {linked_count} existing users"
             )
+
+        if options['dry_run']:
+            summary = (
+                f"\nDry run complete! Would create {len(report['created'])} users, "
+                f"link {len(report['linked'])} existing users"
+            )
+        else:
+            summary = (
+                f"\nCompleted! Created {len(report['created'])} users, "
+                f"linked {len(report['linked'])} existing users"
+            )
+        self.stdout.write(self.style.SUCCESS(summary))
+
+    def report_progress(self, provisioner):
+        done = len(provisioner.report['created'])
+        elapsed = time.perf_counter() - self.started
+        rate = done / elapsed if elapsed else 0
+        self.stdout.write(
+            f"{done}/{provisioner.total} accounts created "
+            f"({elapsed:.1f}s, {rate:.0f} accounts/s, {provisioner.workers} workers)"
         )
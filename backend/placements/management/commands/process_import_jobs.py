@@ -0,0 +1,55 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from placements import jobs
+
+
+class Command(BaseCommand):
+    help = 'Run queued student CSV import and user account jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process every pending job and exit instead of polling',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=5,
+            help='Seconds to wait between polls when the queue is empty (default: 5)',
+        )
+        parser.add_argument('--batch-size', type=int, default=None)
+        parser.add_argument(
+            '--stale-after',
+            type=int,
+            default=int(jobs.STALE_JOB_TIMEOUT.total_seconds() // 60),
+            help='Requeue running jobs without progress for this many minutes',
+        )
+
+    def handle(self, *args, **options):
+        requeued = jobs.requeue_stale_jobs(timedelta(minutes=options['stale_after']))
+        if requeued:
+            self.stdout.write(self.style.WARNING(f"Requeued {requeued} stale import jobs"))
+
+        self.stdout.write('Waiting for import jobs...')
+        while True:
+            close_old_connections()
+            job = jobs.claim_next_job()
+            if job is None:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+
+            self.stdout.write(f"Processing import job {job.pk} ({job.file_name})")
+            job = jobs.run_job(job, batch_size=options['batch_size'])
+            style = self.style.SUCCESS if job.status == 'COMPLETED' else self.style.ERROR
+            self.stdout.write(
+                style(
+                    f"Job {job.pk} {job.status.lower()}: created {job.created_count}, "
+                    f"updated {job.updated_count}, {len(job.errors)} errors"
+                )
+            )
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+from placements import statistics
+from placements.models import PlacementStatistic
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the placement statistics snapshot from the live tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only compare the stored snapshot with the live aggregates',
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            self.check_snapshot()
+            return
+
+        counters = statistics.rebuild_snapshot()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt statistics snapshot ({len(counters)} counters)")
+        )
+
+    def check_snapshot(self):
+        stored = dict(PlacementStatistic.objects.values_list('key', 'value'))
+        if not stored:
+            raise CommandError("No statistics snapshot stored yet; run without --check")
+
+        live = statistics.compute_live_counters()
+        mismatches = []
+        for key in sorted(set(stored) | set(live)):
+            stored_value = stored.get(key, 0)
+            live_value = live.get(key, 0)
+            if stored_value != live_value:
+                mismatches.append(f"{key}: stored={stored_value} live={live_value}")
+
+        if mismatches:
+            for line in mismatches:
+                self.stdout.write(self.style.ERROR(line))
+            raise CommandError(f"Statistics snapshot is out of date ({len(mismatches)} counters differ)")
+
+        self.stdout.write(self.style.SUCCESS("Statistics snapshot matches the live aggregates"))
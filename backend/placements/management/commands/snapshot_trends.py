@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from placements import trends
+
+
+class Command(BaseCommand):
+    help = "Write today's per-branch placement trend snapshot, re-aggregating only what changed"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Re-aggregate every branch instead of only the changed ones',
+        )
+
+    def handle(self, *args, **options):
+        date, recomputed = trends.take_snapshot(full=options['full'])
+        if recomputed is None:
+            detail = 'all branches re-aggregated'
+        elif recomputed:
+            detail = f"re-aggregated {', '.join(sorted(recomputed))}"
+        else:
+            detail = 'no changes since the last run'
+        self.stdout.write(self.style.SUCCESS(f'Trend snapshot for {date}: {detail}'))
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-18 01:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placements', '0002_importantdate_link'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlacementStatistic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100, unique=True)),
+                ('value', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['key'],
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.7 on 2026-10-18 01:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_eligible_branches(apps, schema_editor):
+    Company = apps.get_model('placements', 'Company')
+    CompanyEligibleBranch = apps.get_model('placements', 'CompanyEligibleBranch')
+    rows = []
+    for company_id, eligible_branches in Company.objects.values_list('id', 'eligible_branches'):
+        branches = {branch.strip().upper() for branch in (eligible_branches or '').split(',')}
+        rows.extend(
+            CompanyEligibleBranch(company_id=company_id, branch=branch)
+            for branch in sorted(branches)
+            if branch
+        )
+    CompanyEligibleBranch.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placements', '0004_studentimportjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompanyEligibleBranch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('branch', models.CharField(choices=[('CSE', 'Computer Science and Engineering'), ('IT', 'Information Technology'), ('ECE', 'Electronics and Communication Engineering'), ('ME', 'Mechanical Engineering'), ('CE', 'Civil Engineering'), ('EE', 'Electrical Engineering')], max_length=10)),
+            ],
+            options={
+                'ordering': ['branch'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['branch', 'cgpa'], name='placements__branch_7e0d28_idx'),
+        ),
+        migrations.AddField(
+            model_name='companyeligiblebranch',
+            name='company',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='branch_eligibility', to='placements.company'),
+        ),
+        migrations.AddIndex(
+            model_name='companyeligiblebranch',
+            index=models.Index(fields=['branch', 'company'], name='placements__branch_3816a6_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='companyeligiblebranch',
+            unique_together={('company', 'branch')},
+        ),
+        migrations.RunPython(backfill_eligible_branches, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.7 on 2026-10-18 01:31
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_student_skills(apps, schema_editor):
+    # A snapshot of placements.skills.tokenize at this migration
+    Skill = apps.get_model('placements', 'Skill')
+    Student = apps.get_model('placements', 'Student')
+    StudentSkill = apps.get_model('placements', 'StudentSkill')
+    tokens = {}
+    for student_id, text in Student.objects.values_list('id', 'skills').iterator():
+        names = []
+        for skill in (text or '').split(','):
+            skill = ' '.join(skill.split()).lower()[:100]
+            if skill and skill not in names:
+                names.append(skill)
+        tokens[student_id] = names
+    Skill.objects.bulk_create(
+        [Skill(name=name) for name in sorted({name for names in tokens.values() for name in names})],
+        batch_size=500,
+    )
+    skill_ids = dict(Skill.objects.values_list('name', 'id'))
+    StudentSkill.objects.bulk_create(
+        [
+            StudentSkill(student_id=student_id, skill_id=skill_ids[name])
+            for student_id, names in tokens.items()
+            for name in names
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placements', '0005_companyeligiblebranch'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='StudentSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='student_links', to='placements.skill')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='placements.student')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill', 'student'], name='placements__skill_i_9a655f_idx')],
+                'unique_together': {('student', 'skill')},
+            },
+        ),
+        migrations.RunPython(backfill_student_skills, migrations.RunPython.noop),
+    ]
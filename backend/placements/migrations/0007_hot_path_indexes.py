@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-18 01:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placements', '0006_skill_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='company',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-package_offered'], name='company_active_package_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='importantdate',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['event_date'], name='importantdate_active_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='placementprogress',
+            index=models.Index(fields=['status', '-updated_at'], name='placements__status_3bc7cb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='placementprogress',
+            index=models.Index(fields=['-updated_at', '-id'], name='placements__updated_adfe40_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(condition=models.Q(('is_placed', True)), fields=['branch'], name='student_placed_branch_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['-created_at', '-id'], name='placements__created_cf3dd7_idx'),
+        ),
+    ]
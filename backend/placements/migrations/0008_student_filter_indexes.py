@@ -0,0 +1,43 @@
+# Generated by Django 4.2.7 on 2026-10-18 01:47
+
+from django.db import migrations, models
+
+# ?search= runs UPPER(column) LIKE UPPER('term%') on PostgreSQL, which only
+# an expression index with text_pattern_ops can serve
+SEARCH_COLUMNS = ['name', 'enrollment_number', 'email']
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS student_{column}_prefix_idx '
+            f'ON placements_student (UPPER("{column}"::text) text_pattern_ops)'
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS student_{column}_prefix_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placements', '0007_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['year', 'branch'], name='placements__year_7f92e7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['name', 'id'], name='placements__name_ec8753_idx'),
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
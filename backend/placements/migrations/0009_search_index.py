@@ -0,0 +1,139 @@
+# Generated by Django 4.2.7 on 2026-10-18 01:50
+
+from django.db import OperationalError, migrations, models
+
+# The full-text index over placements_searchentry is vendor specific.
+# SQLite: an external-content FTS5 table kept in sync by triggers.
+# PostgreSQL: a generated tsvector column with a GIN index.
+# Elsewhere, or on SQLite builds without FTS5, search falls back to LIKE.
+SQLITE_FTS = [
+    "CREATE VIRTUAL TABLE placements_searchentry_fts USING fts5("
+    "title, body, content='placements_searchentry', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER placements_searchentry_ai AFTER INSERT ON placements_searchentry BEGIN "
+    "INSERT INTO placements_searchentry_fts(rowid, title, body) VALUES (new.id, new.title, new.body); "
+    "END",
+    "CREATE TRIGGER placements_searchentry_ad AFTER DELETE ON placements_searchentry BEGIN "
+    "INSERT INTO placements_searchentry_fts(placements_searchentry_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); "
+    "END",
+    "CREATE TRIGGER placements_searchentry_au AFTER UPDATE ON placements_searchentry BEGIN "
+    "INSERT INTO placements_searchentry_fts(placements_searchentry_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); "
+    "INSERT INTO placements_searchentry_fts(rowid, title, body) VALUES (new.id, new.title, new.body); "
+    "END",
+]
+
+POSTGRESQL_FTS = [
+    "ALTER TABLE placements_searchentry ADD COLUMN document tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(body, '')), 'B')) STORED",
+    "CREATE INDEX placements_searchentry_document_idx "
+    "ON placements_searchentry USING GIN (document)",
+]
+
+
+def create_fulltext_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        for statement in POSTGRESQL_FTS:
+            schema_editor.execute(statement)
+    elif vendor == 'sqlite':
+        try:
+            schema_editor.execute(SQLITE_FTS[0])
+        except OperationalError:
+            # SQLite compiled without FTS5
+            return
+        for statement in SQLITE_FTS[1:]:
+            schema_editor.execute(statement)
+
+
+def drop_fulltext_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS placements_searchentry_document_idx')
+        schema_editor.execute('ALTER TABLE placements_searchentry DROP COLUMN IF EXISTS document')
+    elif vendor == 'sqlite':
+        for suffix in ['ai', 'ad', 'au']:
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS placements_searchentry_{suffix}')
+        schema_editor.execute('DROP TABLE IF EXISTS placements_searchentry_fts')
+
+
+def _join(*parts):
+    return ' · '.join(str(part) for part in parts if part)
+
+
+def backfill_search_entries(apps, schema_editor):
+    # A snapshot of placements.search's document builders at this migration
+    SearchEntry = apps.get_model('placements', 'SearchEntry')
+    documents = {
+        'student': (
+            apps.get_model('placements', 'Student'),
+            lambda s: (
+                s.name,
+                _join(s.enrollment_number, s.get_branch_display()),
+                ' '.join([s.enrollment_number, s.email, s.branch, s.skills]),
+            ),
+        ),
+        'company': (
+            apps.get_model('placements', 'Company'),
+            lambda c: (
+                c.name,
+                _join(c.job_role, c.job_location),
+                ' '.join([c.job_role, c.job_location, c.get_company_type_display(), c.description]),
+            ),
+        ),
+        'important_date': (
+            apps.get_model('placements', 'ImportantDate'),
+            lambda d: (
+                d.title,
+                _join(d.get_event_type_display(), d.location),
+                ' '.join([d.location, d.description]),
+            ),
+        ),
+    }
+    for kind, (model, build) in documents.items():
+        rows = []
+        for obj in model.objects.order_by('pk').iterator(chunk_size=2000):
+            title, subtitle, body = build(obj)
+            rows.append(
+                SearchEntry(
+                    kind=kind,
+                    object_id=obj.pk,
+                    title=title[:200],
+                    subtitle=subtitle[:255],
+                    body=body,
+                )
+            )
+            if len(rows) >= 2000:
+                SearchEntry.objects.bulk_create(rows)
+                rows = []
+        SearchEntry.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placements', '0008_student_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('student', 'Student'), ('company', 'Company'), ('important_date', 'Important Date')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(max_length=200)),
+                ('subtitle', models.CharField(blank=True, max_length=255)),
+                ('body', models.TextField(blank=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+        # After the index, so the FTS5 insert trigger indexes the backfilled rows
+        migrations.RunPython(backfill_search_entries, migrations.RunPython.noop),
+    ]
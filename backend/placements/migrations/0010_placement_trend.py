@@ -0,0 +1,39 @@
+# Generated by Django 4.2.7 on 2026-10-18 01:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placements', '0009_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlacementTrend',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('branch', models.CharField(choices=[('CSE', 'Computer Science and Engineering'), ('IT', 'Information Technology'), ('ECE', 'Electronics and Communication Engineering'), ('ME', 'Mechanical Engineering'), ('CE', 'Civil Engineering'), ('EE', 'Electrical Engineering')], max_length=10)),
+                ('total_students', models.PositiveIntegerField(default=0)),
+                ('placed_students', models.PositiveIntegerField(default=0)),
+                ('applications', models.PositiveIntegerField(default=0)),
+                ('offers', models.PositiveIntegerField(default=0)),
+                ('offers_accepted', models.PositiveIntegerField(default=0)),
+                ('accepted_package_sum', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'ordering': ['date', 'branch'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['updated_at'], name='placements__updated_4054a2_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='placementtrend',
+            unique_together={('date', 'branch')},
+        ),
+    ]
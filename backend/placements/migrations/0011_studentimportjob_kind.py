@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 02:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placements', '0010_placement_trend'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentimportjob',
+            name='kind',
+            field=models.CharField(choices=[('CSV_IMPORT', 'Student CSV import'), ('ACCOUNTS', 'Student user accounts')], default='CSV_IMPORT', max_length=20),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 02:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('placements', '0011_studentimportjob_kind'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(condition=models.Q(('is_placed', False)), fields=['branch'], name='student_unplaced_branch_idx'),
+        ),
+    ]
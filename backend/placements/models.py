@@ -46,6 +46,25 @@ class Student(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["branch", "cgpa"]),
+            # Partial: SQLite renders is_placed=True as a bare column test,
+            # which can only use an index whose WHERE clause matches it
+            models.Index(
+                fields=["branch"],
+                condition=models.Q(is_placed=True),
+                name="student_placed_branch_idx",
+            ),
+            models.Index(
+                fields=["branch"],
+                condition=models.Q(is_placed=False),
+                name="student_unplaced_branch_idx",
+            ),
+            models.Index(fields=["-created_at", "-id"]),
+            models.Index(fields=["year", "branch"]),
+            models.Index(fields=["name", "id"]),
+            models.Index(fields=["updated_at"]),
+        ]
 
     def __str__(self):
         return f"{self.enrollment_number} - {self.name}"
@@ -86,6 +105,13 @@ class Company(models.Model):
     class Meta:
         ordering = ["-package_offered"]
         verbose_name_plural = "Companies"
+        indexes = [
+            models.Index(
+                fields=["-package_offered"],
+                condition=models.Q(is_active=True),
+                name="company_active_package_idx",
+            )
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.job_role}"
@@ -148,6 +174,10 @@ class PlacementProgress(models.Model):
     class Meta:
         ordering = ["-updated_at"]
         unique_together = ["student", "company"]
+        indexes = [
+            models.Index(fields=["status", "-updated_at"]),
+            models.Index(fields=["-updated_at", "-id"]),
+        ]
 
     def __str__(self):
         return f"{self.student.name} - {self.company.name} ({self.status})"
@@ -208,6 +238,191 @@ class ImportantDate(models.Model):
 
     class Meta:
         ordering = ["event_date"]
+        indexes = [
+            models.Index(
+                fields=["event_date"],
+                condition=models.Q(is_active=True),
+                name="importantdate_active_date_idx",
+            )
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.event_date.strftime('%Y-%m-%d')}"
+
+
+class PlacementStatistic(models.Model):
+    """
+    One counter of the persisted statistics snapshot served by
+    /placement-progress/statistics/. Rows are kept current by the signal
+    handlers in placements.signals and rebuilt by `rebuild_statistics`.
+    """
+
+    key = models.CharField(max_length=100, unique=True)
+    value = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["key"]
+
+    def __str__(self):
+        return f"{self.key} = {self.value}"
+
+
+class PlacementTrend(models.Model):
+    """
+    One branch's placement totals on one day, for the season charts served
+    by /placement-progress/statistics/trend/. Written by `snapshot_trends`;
+    re-running it on the same day overwrites that day's rows.
+    """
+
+    date = models.DateField()
+    branch = models.CharField(max_length=10, choices=Student.BRANCH_CHOICES)
+    total_students = models.PositiveIntegerField(default=0)
+    placed_students = models.PositiveIntegerField(default=0)
+    applications = models.PositiveIntegerField(default=0)
+    offers = models.PositiveIntegerField(default=0)
+    offers_accepted = models.PositiveIntegerField(default=0)
+    accepted_package_sum = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ["date", "branch"]
+        unique_together = ["date", "branch"]
+
+    def __str__(self):
+        return f"{self.date} {self.branch}: {self.placed_students}/{self.total_students}"
+
+
+class StudentImportJob(models.Model):
+    """
+    A student CSV upload queued for the `process_import_jobs` worker.
+    The raw CSV is kept in the database so the worker needs no shared
+    filesystem or message broker, and is cleared once the job finishes.
+    ACCOUNTS jobs create user accounts instead; their payload is the
+    comma-separated ids of the students to provision.
+    """
+
+    KIND_CHOICES = [
+        ("CSV_IMPORT", "Student CSV import"),
+        ("ACCOUNTS", "Student user accounts"),
+    ]
+
+    STATUS_CHOICES = [
+        ("PENDING", "Pending"),
+        ("RUNNING", "Running"),
+        ("COMPLETED", "Completed"),
+        ("FAILED", "Failed"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default="CSV_IMPORT")
+    file_name = models.CharField(max_length=255)
+    payload = models.BinaryField(blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="PENDING")
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="student_import_jobs",
+    )
+    total_rows = models.PositiveIntegerField(
+        default=0, help_text="Estimated from the line count at upload time"
+    )
+    processed_rows = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    updated_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)
+    error_message = models.TextField(blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [models.Index(fields=["status", "created_at"])]
+
+    def __str__(self):
+        return f"{self.file_name} ({self.status})"
+
+
+class CompanyEligibleBranch(models.Model):
+    """
+    Indexed form of `Company.eligible_branches`, kept in sync by a signal
+    so eligibility can be resolved with a join instead of string parsing
+    """
+
+    company = models.ForeignKey(
+        Company, on_delete=models.CASCADE, related_name="branch_eligibility"
+    )
+    branch = models.CharField(max_length=10, choices=Student.BRANCH_CHOICES)
+
+    class Meta:
+        ordering = ["branch"]
+        unique_together = ["company", "branch"]
+        indexes = [models.Index(fields=["branch", "company"])]
+
+    def __str__(self):
+        return f"{self.company.name} - {self.branch}"
+
+
+class Skill(models.Model):
+    """A normalized (lower-case, trimmed) skill name from `Student.skills`"""
+
+    name = models.CharField(max_length=100, unique=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+
+class StudentSkill(models.Model):
+    """
+    Inverted index from skills to students, rebuilt from `Student.skills`
+    whenever it changes
+    """
+
+    student = models.ForeignKey(
+        Student, on_delete=models.CASCADE, related_name="skill_links"
+    )
+    skill = models.ForeignKey(
+        Skill, on_delete=models.CASCADE, related_name="student_links"
+    )
+
+    class Meta:
+        unique_together = ["student", "skill"]
+        indexes = [models.Index(fields=["skill", "student"])]
+
+    def __str__(self):
+        return f"{self.student_id} - {self.skill_id}"
+
+
+class SearchEntry(models.Model):
+    """
+    One document of the /api/search/ index: a student, company or
+    important date flattened to a title and body. Kept in sync by the
+    signal handlers in placements.signals and rebuilt by `index_search`;
+    the full-text index over these rows (FTS5 on SQLite, tsvector/GIN on
+    PostgreSQL) is created by migration 0009.
+    """
+
+    KIND_CHOICES = [
+        ("student", "Student"),
+        ("company", "Company"),
+        ("important_date", "Important Date"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=200)
+    subtitle = models.CharField(max_length=255, blank=True)
+    body = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ["kind", "object_id"]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id}: {self.title}"
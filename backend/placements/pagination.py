@@ -0,0 +1,191 @@
+"""
+Keyset (cursor) pagination for the large list endpoints.
+
+Page-number pagination stays the default. Passing ?pagination=cursor (or a
+?cursor= token) switches a viewset that sets `cursor_pagination_class` to
+keyset pagination, which seeks with a WHERE clause on the ordering fields
+instead of COUNT(*) plus OFFSET.
+"""
+import json
+from collections import OrderedDict
+
+from django.db import connection
+from django.db.models import Q
+from rest_framework.pagination import CursorPagination, _reverse_ordering
+from rest_framework.response import Response
+
+# Cap on ?count=estimate when no planner statistics are available
+ESTIMATE_COUNT_LIMIT = 1000
+
+
+def estimate_count(queryset):
+    """
+    Cheap row count. Unfiltered PostgreSQL tables use the planner's
+    reltuples estimate. Everything else (SQLite, filtered querysets) gets a
+    capped count, not an estimate: COUNT(*) over a LIMIT subquery that stops
+    reading after ESTIMATE_COUNT_LIMIT + 1 rows, reported as the cap when
+    there are more. Returns (count, is_exact).
+    """
+    if connection.vendor == "postgresql" and not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        if row and row[0] >= 0:
+            return row[0], False
+
+    count = queryset.order_by()[: ESTIMATE_COUNT_LIMIT + 1].count()
+    if count > ESTIMATE_COUNT_LIMIT:
+        return ESTIMATE_COUNT_LIMIT, False
+    return count, True
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Cursor pagination keyed on every ordering field, `id` included, so the
+    position is unique and each page is a single index seek.
+
+    DRF's CursorPagination only seeks on the first ordering field and falls
+    back to OFFSET for ties; here the position holds every ordering value.
+    Orderings that mix directions fall back to DRF's behaviour.
+
+    ?count=estimate adds an estimated total; ?count=exact runs COUNT(*).
+    """
+
+    ordering = ("-created_at", "-id")
+    count_query_param = "count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = None
+        self.count_is_exact = True
+        count_mode = request.query_params.get(self.count_query_param)
+        if count_mode == "exact":
+            self.count = queryset.count()
+        elif count_mode == "estimate":
+            self.count, self.count_is_exact = estimate_count(queryset)
+
+        ordering = self.get_ordering(request, queryset, view)
+        if len({field.startswith("-") for field in ordering}) != 1:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = ordering
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            # Test for: (cursor reversed) XOR (queryset reversed)
+            descending = self.ordering[0].startswith("-")
+            queryset = queryset.filter(
+                self._seek(current_position, before=self.cursor.reverse != descending)
+            )
+
+        results = list(queryset[offset:offset + self.page_size + 1])
+        self.page = list(results[:self.page_size])
+
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(results[-1], self.ordering)
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = (current_position is not None) or (offset > 0)
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def _seek(self, position, before):
+        """Row-value comparison (f1, f2, ...) < or > position, spelled out with Q"""
+        values = json.loads(position)
+        fields = [field.lstrip("-") for field in self.ordering]
+        lookup = "lt" if before else "gt"
+        condition = Q()
+        for index, field in enumerate(fields):
+            equal = {fields[i]: values[i] for i in range(index)}
+            condition |= Q(**equal, **{f"{field}__{lookup}": values[index]})
+        return condition
+
+    def _get_position_from_instance(self, instance, ordering):
+        if len({field.startswith("-") for field in ordering}) != 1:
+            return super()._get_position_from_instance(instance, ordering)
+        values = []
+        for field in ordering:
+            name = field.lstrip("-")
+            # Rows from the ?fast=1 path are .values() dicts
+            value = instance[name] if isinstance(instance, dict) else getattr(instance, name)
+            values.append(value.isoformat() if hasattr(value, "isoformat") else str(value))
+        return json.dumps(values, separators=(",", ":"))
+
+    def get_paginated_response(self, data):
+        response = OrderedDict()
+        if self.count is not None:
+            response["count"] = self.count
+            response["count_is_estimate"] = not self.count_is_exact
+        response["next"] = self.get_next_link()
+        response["previous"] = self.get_previous_link()
+        response["results"] = data
+        return Response(response)
+
+
+class StudentCursorPagination(KeysetCursorPagination):
+    ordering = ("-created_at", "-id")
+
+
+class PlacementProgressCursorPagination(KeysetCursorPagination):
+    ordering = ("-updated_at", "-id")
+
+
+class SelectablePaginationMixin:
+    """
+    Let clients choose keyset pagination per request with ?pagination=cursor;
+    following a `next` link keeps it selected through the ?cursor= token
+    """
+
+    cursor_pagination_class = None
+
+    def uses_cursor_pagination(self):
+        params = self.request.query_params
+        return self.cursor_pagination_class is not None and (
+            params.get("pagination") == "cursor" or "cursor" in params
+        )
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            if self.request is not None and self.uses_cursor_pagination():
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class() if self.pagination_class else None
+        return self._paginator
@@ -0,0 +1,219 @@
+"""
+Bulk user account provisioning for students.
+
+Creating accounts one `create_user` call at a time costs one full PBKDF2
+hash and one INSERT per student. `AccountProvisioner` first links students
+to matching users that have no profile, then creates the rest in batches:
+the passwords of a batch are hashed in a process pool across all cores,
+the users go in with one `bulk_create` and the links with one
+`bulk_update`. Only STUDENT users are ever linked; a profile matching an
+admin or company account is reported and left alone.
+
+The pool belongs in a worker, not a web request: the admin action queues a
+job for `process_import_jobs`.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from . import caching
+from .models import Student
+
+User = get_user_model()
+
+PASSWORD_HASH_WORKERS = getattr(settings, "PASSWORD_HASH_WORKERS", 0)
+
+# Below this many passwords a pool costs more to start than it saves
+MIN_PARALLEL_PASSWORDS = 16
+
+
+class ProvisioningError(Exception):
+    pass
+
+
+def default_password(student):
+    """
+    First name plus the last four characters of the enrollment number;
+    the whole enrollment number stands in for a blank name
+    """
+    names = student.name.split()
+    first = names[0] if names else student.enrollment_number
+    return f"{first.lower()}{student.enrollment_number[-4:]}"
+
+
+def user_fields(student):
+    """Fields of the STUDENT user account created for `student`"""
+    names = student.name.split()
+    return {
+        "username": student.enrollment_number.lower(),
+        "email": student.email,
+        "first_name": names[0] if names else "",
+        "last_name": " ".join(names[1:]),
+        "role": "STUDENT",
+        "phone": student.phone,
+    }
+
+
+def _setup_worker(settings_module):
+    # Spawned workers (macOS, Windows) start without a configured Django
+    if not apps.ready:
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+        django.setup()
+
+
+def hash_passwords(passwords, executor=None, workers=1):
+    """`make_password` of every password, on `executor`'s `workers` if given"""
+    if executor is None or len(passwords) < MIN_PARALLEL_PASSWORDS:
+        return [make_password(password) for password in passwords]
+    chunksize = max(1, len(passwords) // (workers * 4))
+    return list(executor.map(make_password, passwords, chunksize=chunksize))
+
+
+class AccountProvisioner:
+    """
+    Link or create user accounts for `students`. With `dry_run` nothing is
+    hashed or written; the report says what would have happened.
+    `progress(provisioner)` is called after every batch of created users.
+    """
+
+    def __init__(self, workers=None, batch_size=500, dry_run=False, link_only=False, progress=None):
+        if workers is None:
+            workers = PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+        self.workers = workers
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.link_only = link_only
+        self.progress = progress
+        self.total = 0
+        self.report = {"linked": [], "created": [], "skipped": []}
+
+    def run(self, students):
+        """
+        Returns the report: `linked` students, `created` (student, password)
+        pairs and `skipped` (student, reason) pairs
+        """
+        students = [student for student in students if student.user_id is None]
+        remaining = self.link_existing_users(students)
+        if not self.link_only:
+            self.create_users(self.plan_new_users(remaining))
+        return self.report
+
+    def save_links(self, students):
+        """Write `students`' user links, as a save() with its signals would"""
+        now = timezone.now()
+        for student in students:
+            student.updated_at = now
+        Student.objects.bulk_update(students, ["user", "updated_at"], batch_size=self.batch_size)
+        # bulk_update skips the signals that invalidate cached student lookups
+        transaction.on_commit(lambda: caching.bump_version("students"))
+
+    def link_existing_users(self, students):
+        """
+        Match students to users without a profile by username (enrollment
+        number) or email. Returns the students left unmatched; those matching
+        a user with another role are skipped instead.
+        """
+        candidates = User.objects.filter(student_profile__isnull=True).only(
+            "id", "username", "email", "role"
+        )
+        by_username = {user.username.upper(): user for user in candidates}
+        by_email = {user.email.lower(): user for user in candidates if user.email}
+
+        linked = []
+        remaining = []
+        taken = set()
+        for student in students:
+            user = by_username.get(student.enrollment_number.upper()) or by_email.get(
+                student.email.lower()
+            )
+            if user is None or user.pk in taken:
+                remaining.append(student)
+                continue
+            if user.role != "STUDENT":
+                self.report["skipped"].append(
+                    (student, f"matches {user.get_role_display()} user {user.username}")
+                )
+                continue
+            taken.add(user.pk)
+            student.user = user
+            linked.append(student)
+
+        if linked and not self.dry_run:
+            self.save_links(linked)
+        self.report["linked"] = linked
+        return remaining
+
+    def plan_new_users(self, students):
+        """Students that get a new account; the others are reported as skipped"""
+        usernames = [user_fields(student)["username"] for student in students]
+        taken = {
+            username.lower()
+            for username in User.objects.filter(username__in=usernames).values_list(
+                "username", flat=True
+            )
+        }
+        planned = []
+        for student, username in zip(students, usernames):
+            if username in taken:
+                self.report["skipped"].append(
+                    (student, f"user {username} is linked to another student")
+                )
+                continue
+            taken.add(username)
+            planned.append(student)
+        self.total = len(planned)
+        return planned
+
+    def create_users(self, students):
+        if self.dry_run:
+            self.report["created"] = [
+                (student, default_password(student)) for student in students
+            ]
+            return
+        if not students:
+            return
+
+        executor = None
+        if self.workers > 1 and len(students) >= MIN_PARALLEL_PASSWORDS:
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_setup_worker,
+                initargs=(os.environ.get("DJANGO_SETTINGS_MODULE", ""),),
+            )
+        try:
+            for start in range(0, len(students), self.batch_size):
+                self.create_batch(students[start:start + self.batch_size], executor)
+                if self.progress:
+                    self.progress(self)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    @transaction.atomic
+    def create_batch(self, students, executor):
+        passwords = [default_password(student) for student in students]
+        hashes = hash_passwords(passwords, executor, self.workers)
+
+        users = []
+        for student, password_hash in zip(students, hashes):
+            fields = user_fields(student)
+            fields["username"] = User.normalize_username(fields["username"])
+            fields["email"] = User.objects.normalize_email(fields["email"])
+            users.append(User(password=password_hash, **fields))
+        users = User.objects.bulk_create(users)
+        if users and users[0].pk is None:
+            raise ProvisioningError(
+                "The database backend does not return ids from bulk inserts"
+            )
+
+        for student, user in zip(students, users):
+            student.user = user
+        self.save_links(students)
+        self.report["created"].extend(zip(students, passwords))
@@ -0,0 +1,78 @@
+"""
+Resolve which student a request is scoped to.
+
+The user-to-student mapping is looked up once per request. With a shared
+cache it is also cached across requests under the "students" version, so any
+Student write (including bulk CSV imports) drops every cached mapping; a
+process-local cache would only drop it in the worker that wrote, so there
+the lookup runs on every request. The mapping is never taken from the JWT:
+a claim issued at login would outlive relinking or deleting the profile,
+since refreshed tokens copy it. The lookup never writes; unlinked profiles
+are linked in bulk by the `link_student_users` command.
+"""
+from accounts.tokens import shared_cache
+from django.core.cache import cache
+from django.db.models import Q
+
+from . import caching
+from .models import Student
+
+STUDENT_ID_TIMEOUT = 60 * 15
+
+# Cached for users without a matching profile, since None means a cache miss
+NO_STUDENT = 0
+
+
+def lookup_student_id(user):
+    """Id of the user's linked profile, or of an unlinked one matching it"""
+    student_id = Student.objects.filter(user=user).values_list("pk", flat=True).first()
+    if student_id is None:
+        match = Q(enrollment_number=user.username.upper())
+        if user.email:
+            match |= Q(email=user.email)
+        student_id = (
+            Student.objects.filter(match, user__isnull=True)
+            .values_list("pk", flat=True)
+            .first()
+        )
+    return student_id
+
+
+def _cached_student_id(user):
+    key = caching.versioned_key("student-id", caching.get_versions("students"), user.pk)
+    student_id = cache.get(key)
+    if student_id is None:
+        student_id = lookup_student_id(user) or NO_STUDENT
+        cache.set(key, student_id, STUDENT_ID_TIMEOUT)
+    return student_id
+
+
+def get_student_id(request):
+    """Student id for the requesting user, or None if they have no profile"""
+    if not hasattr(request, "_scoped_student_id"):
+        student_id = None
+        user = request.user
+        if user.is_authenticated and user.is_student:
+            if shared_cache():
+                student_id = _cached_student_id(user)
+            else:
+                student_id = lookup_student_id(user)
+        request._scoped_student_id = student_id or None
+    return request._scoped_student_id
+
+
+def can_see_all(user):
+    return user.is_authenticated and (user.is_admin or user.is_staff)
+
+
+def scope_queryset(request, queryset, student_field):
+    """
+    Admins see everything, students only rows whose `student_field` points
+    at their own profile, everyone else nothing
+    """
+    if can_see_all(request.user):
+        return queryset
+    student_id = get_student_id(request)
+    if student_id is None:
+        return queryset.none()
+    return queryset.filter(**{student_field: student_id})
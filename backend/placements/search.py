@@ -0,0 +1,212 @@
+"""
+Full-text search over students, companies and important dates.
+
+Each searchable object is flattened into a `SearchEntry` row. The rows are
+indexed by FTS5 on SQLite and by a tsvector/GIN index on PostgreSQL (see
+migration 0009), so a query is one ranked index lookup instead of an
+`icontains` scan per table. Other backends, and SQLite builds without
+FTS5, fall back to LIKE over the entries.
+"""
+import re
+from functools import reduce
+from operator import and_
+
+from django.db import connection
+from django.db.models import Q
+
+from .models import Company, ImportantDate, SearchEntry, Student
+
+STUDENT = "student"
+COMPANY = "company"
+IMPORTANT_DATE = "important_date"
+
+KINDS = [kind for kind, _ in SearchEntry.KIND_CHOICES]
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 50
+MAX_TERMS = 8
+
+SQLITE_FTS_TABLE = "placements_searchentry_fts"
+
+TITLE_LENGTH = SearchEntry._meta.get_field("title").max_length
+SUBTITLE_LENGTH = SearchEntry._meta.get_field("subtitle").max_length
+
+
+def _join(*parts):
+    return " · ".join(str(part) for part in parts if part)
+
+
+def student_document(student):
+    return (
+        student.name,
+        _join(student.enrollment_number, student.get_branch_display()),
+        " ".join(
+            [student.enrollment_number, student.email, student.branch, student.skills]
+        ),
+    )
+
+
+def company_document(company):
+    return (
+        company.name,
+        _join(company.job_role, company.job_location),
+        " ".join(
+            [
+                company.job_role,
+                company.job_location,
+                company.get_company_type_display(),
+                company.description,
+            ]
+        ),
+    )
+
+
+def important_date_document(important_date):
+    return (
+        important_date.title,
+        _join(important_date.get_event_type_display(), important_date.location),
+        " ".join([important_date.location, important_date.description]),
+    )
+
+
+DOCUMENTS = {
+    STUDENT: (Student, student_document),
+    COMPANY: (Company, company_document),
+    IMPORTANT_DATE: (ImportantDate, important_date_document),
+}
+
+MODEL_KINDS = {model: kind for kind, (model, _) in DOCUMENTS.items()}
+
+
+def index_objects(kind, objects):
+    """Replace the search entries of `objects`, which are all of type `kind`"""
+    build = DOCUMENTS[kind][1]
+    entries = []
+    for obj in objects:
+        title, subtitle, body = build(obj)
+        entries.append(
+            SearchEntry(
+                kind=kind,
+                object_id=obj.pk,
+                title=title[:TITLE_LENGTH],
+                subtitle=subtitle[:SUBTITLE_LENGTH],
+                body=body,
+            )
+        )
+    if not entries:
+        return 0
+    remove_objects(kind, [entry.object_id for entry in entries])
+    return len(SearchEntry.objects.bulk_create(entries, batch_size=500))
+
+
+def remove_objects(kind, ids):
+    SearchEntry.objects.filter(kind=kind, object_id__in=ids).delete()
+
+
+def tokenize(query):
+    """Lower-cased word terms of `query`, at most MAX_TERMS of them"""
+    return re.findall(r"\w+", query.lower())[:MAX_TERMS]
+
+
+_fts_backends = {}
+
+
+def fts_backend():
+    """'sqlite' or 'postgresql' if a full-text index exists, else None"""
+    if connection.alias not in _fts_backends:
+        backend = None
+        if connection.vendor == "postgresql":
+            backend = "postgresql"
+        elif connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                if SQLITE_FTS_TABLE in connection.introspection.table_names(cursor):
+                    backend = "sqlite"
+        _fts_backends[connection.alias] = backend
+    return _fts_backends[connection.alias]
+
+
+def _scope(kinds, student_id, all_students):
+    """SQL conditions on the `e` entry alias limiting kinds and visible students"""
+    where, params = [], []
+    where.append(f"e.kind IN ({', '.join(['%s'] * len(kinds))})")
+    params.extend(kinds)
+    if not all_students:
+        # Students only ever find their own profile
+        where.append("(e.kind <> %s OR e.object_id = %s)")
+        params.extend([STUDENT, student_id or 0])
+    return where, params
+
+
+def _search_sqlite(terms, where, params, limit):
+    match = " ".join(f'"{term}"*' for term in terms)
+    sql = (
+        f"SELECT e.kind, e.object_id, e.title, e.subtitle, "
+        f"-bm25({SQLITE_FTS_TABLE}, 10.0, 1.0) AS score "
+        f"FROM {SQLITE_FTS_TABLE} JOIN placements_searchentry e "
+        f"ON e.id = {SQLITE_FTS_TABLE}.rowid "
+        f"WHERE {SQLITE_FTS_TABLE} MATCH %s AND {' AND '.join(where)} "
+        f"ORDER BY score DESC, e.id LIMIT %s"
+    )
+    return sql, [match, *params, limit]
+
+
+def _search_postgresql(terms, where, params, limit):
+    tsquery = " & ".join(f"{term}:*" for term in terms)
+    sql = (
+        "SELECT e.kind, e.object_id, e.title, e.subtitle, "
+        "ts_rank(e.document, query) AS score "
+        "FROM placements_searchentry e, to_tsquery('simple', %s) query "
+        f"WHERE e.document @@ query AND {' AND '.join(where)} "
+        "ORDER BY score DESC, e.id LIMIT %s"
+    )
+    return sql, [tsquery, *params, limit]
+
+
+def _search_fallback(terms, kinds, student_id, all_students, limit):
+    entries = SearchEntry.objects.filter(kind__in=kinds).filter(
+        reduce(and_, [Q(title__icontains=term) | Q(body__icontains=term) for term in terms])
+    )
+    if not all_students:
+        entries = entries.exclude(~Q(object_id=student_id or 0), kind=STUDENT)
+    return [
+        {**row, "score": None}
+        for row in entries.order_by("kind", "title", "id").values(
+            "kind", "object_id", "title", "subtitle"
+        )[:limit]
+    ]
+
+
+def search(query, kinds=None, student_id=None, all_students=False, limit=DEFAULT_LIMIT):
+    """
+    Ranked entries matching every word of `query` as a prefix. Students
+    other than `student_id` are left out unless `all_students` is set.
+    Returns dicts with kind, object_id, title, subtitle and score.
+    """
+    terms = tokenize(query)
+    kinds = [kind for kind in (kinds or KINDS) if kind in KINDS]
+    if not terms or not kinds:
+        return []
+
+    backend = fts_backend()
+    if backend is None:
+        return _search_fallback(terms, kinds, student_id, all_students, limit)
+
+    where, params = _scope(kinds, student_id, all_students)
+    build = _search_sqlite if backend == "sqlite" else _search_postgresql
+    sql, params = build(terms, where, params, limit)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        columns = [column[0] for column in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    for row in rows:
+        row["score"] = round(float(row["score"]), 4)
+    return rows
+
+
+def rebuild_fts_index():
+    """Re-read every entry into the FTS5 table; PostgreSQL needs no rebuild"""
+    if fts_backend() == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')"
+            )
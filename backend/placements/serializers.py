@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db.models import Prefetch
 
 from .models import (
     Company,
@@ -8,12 +9,96 @@ from .models import (
     PlacementStage,
     StageProgress,
     Student,
+    StudentImportJob,
 )
+from .provisioning import default_password, user_fields
 
 User = get_user_model()
 
 
-class StudentSerializer(serializers.ModelSerializer):
+class EagerLoadingMixin:
+    """
+    Declares the relations a serializer reads so that viewsets can load them
+    up front instead of issuing one query per row
+    """
+
+    select_related_fields = []
+    prefetch_related_fields = []
+
+    @classmethod
+    def get_prefetch_related(cls):
+        return list(cls.prefetch_related_fields)
+
+    @classmethod
+    def relations_for(cls, fields):
+        """Relations the declared fields among `fields` read through"""
+        return {
+            (field.source or name).split(".")[0]
+            for name, field in cls._declared_fields.items()
+            if name in fields
+        }
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, fields=None):
+        """Load related rows up front; `fields` skips relations nobody reads"""
+        select_related = list(cls.select_related_fields)
+        prefetches = cls.get_prefetch_related()
+        if fields is not None:
+            relations = cls.relations_for(fields)
+            select_related = [
+                name for name in select_related if name.split("__")[0] in relations
+            ]
+            prefetches = [
+                prefetch
+                for prefetch in prefetches
+                if getattr(prefetch, "prefetch_through", prefetch).split("__")[0]
+                in relations
+            ]
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetches:
+            queryset = queryset.prefetch_related(*prefetches)
+        return queryset
+
+
+def _query_param_set(request, name):
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    return {item.strip() for item in value.split(",") if item.strip()}
+
+
+class DynamicFieldsMixin:
+    """
+    Sparse fieldsets for GET requests: ?fields=id,name keeps only those
+    fields. Nested relations in `expandable_fields` are part of the default
+    shape, but with ?fields= they are only included when named there or in
+    ?expand=. Only applies to serializers created with the request in their
+    context, i.e. the viewset's own serializer, not nested ones.
+    """
+
+    expandable_fields = []
+
+    @classmethod
+    def requested_fields(cls, request):
+        """Field names a GET request selected, or None for the default shape"""
+        if request is None or request.method != "GET":
+            return None
+        fields = _query_param_set(request, "fields")
+        if fields is None:
+            return None
+        expand = _query_param_set(request, "expand") or set()
+        return fields | (expand & set(cls.expandable_fields))
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields = self.requested_fields(self.context.get("request"))
+        if fields is not None:
+            for name in set(self.fields) - fields:
+                self.fields.pop(name)
+
+
+class StudentSerializer(DynamicFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     branch_display = serializers.CharField(source="get_branch_display", read_only=True)
     year_display = serializers.CharField(source="get_year_display", read_only=True)
     user = serializers.PrimaryKeyRelatedField(
@@ -42,26 +127,18 @@ class StudentSerializer(serializers.ModelSerializer):
             # Use provided password or generate a default one
             if not password:
                 # Default password: first name + enrollment number
-                password = f"{student.name.split()[0].lower()}{student.enrollment_number[-4:]}"
+                password = default_password(student)
             
             # Check if user already exists
             if not User.objects.filter(username=username).exists():
-                user = User.objects.create_user(
-                    username=username,
-                    email=student.email,
-                    password=password,
-                    first_name=student.name.split()[0] if student.name else '',
-                    last_name=' '.join(student.name.split()[1:]) if len(student.name.split()) > 1 else '',
-                    role='STUDENT',
-                    phone=student.phone
-                )
+                user = User.objects.create_user(password=password, **user_fields(student))
                 student.user = user
                 student.save()
         
         return student
 
 
-class CompanySerializer(serializers.ModelSerializer):
+class CompanySerializer(DynamicFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     company_type_display = serializers.CharField(
         source="get_company_type_display", read_only=True
     )
@@ -72,7 +149,7 @@ class CompanySerializer(serializers.ModelSerializer):
         read_only_fields = ["created_at", "updated_at"]
 
 
-class PlacementStageSerializer(serializers.ModelSerializer):
+class PlacementStageSerializer(DynamicFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     stage_type_display = serializers.CharField(
         source="get_stage_type_display", read_only=True
     )
@@ -82,17 +159,19 @@ class PlacementStageSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class StageProgressSerializer(serializers.ModelSerializer):
+class StageProgressSerializer(DynamicFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     stage_name = serializers.CharField(source="stage.name", read_only=True)
     result_display = serializers.CharField(source="get_result_display", read_only=True)
 
+    select_related_fields = ["stage"]
+
     class Meta:
         model = StageProgress
         fields = "__all__"
         read_only_fields = ["created_at", "updated_at"]
 
 
-class PlacementProgressSerializer(serializers.ModelSerializer):
+class PlacementProgressSerializer(DynamicFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     student_name = serializers.CharField(source="student.name", read_only=True)
     student_enrollment = serializers.CharField(
         source="student.enrollment_number", read_only=True
@@ -104,19 +183,99 @@ class PlacementProgressSerializer(serializers.ModelSerializer):
     status_display = serializers.CharField(source="get_status_display", read_only=True)
     stage_details = StageProgressSerializer(many=True, read_only=True)
 
+    select_related_fields = ["student", "company", "current_stage"]
+    expandable_fields = ["stage_details"]
+
+    @classmethod
+    def get_prefetch_related(cls):
+        return [
+            Prefetch(
+                "stage_details",
+                queryset=StageProgressSerializer.setup_eager_loading(
+                    StageProgress.objects.all()
+                ),
+            )
+        ]
+
     class Meta:
         model = PlacementProgress
         fields = "__all__"
         read_only_fields = ["created_at", "updated_at", "application_date"]
 
 
-class ImportantDateSerializer(serializers.ModelSerializer):
+class ImportantDateSerializer(DynamicFieldsMixin, EagerLoadingMixin, serializers.ModelSerializer):
     event_type_display = serializers.CharField(
         source="get_event_type_display", read_only=True
     )
     company_name = serializers.CharField(source="company.name", read_only=True)
 
+    select_related_fields = ["company"]
+
     class Meta:
         model = ImportantDate
         fields = "__all__"
         read_only_fields = ["created_at", "updated_at"]
+
+
+class StudentImportJobSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    status_display = serializers.CharField(source="get_status_display", read_only=True)
+    progress = serializers.SerializerMethodField()
+
+    class Meta:
+        model = StudentImportJob
+        exclude = ["payload"]
+        read_only_fields = [
+            field.name for field in StudentImportJob._meta.fields if field.name != "payload"
+        ]
+
+    def get_progress(self, obj):
+        """Percentage of rows processed, based on the upload's line count"""
+        if obj.status == "COMPLETED":
+            return 100
+        if not obj.total_rows:
+            return 0
+        return min(round(obj.processed_rows / obj.total_rows * 100, 1), 100)
+
+
+class StageAdvanceEntrySerializer(serializers.Serializer):
+    progress_id = serializers.IntegerField()
+    result = serializers.ChoiceField(choices=StageProgress.RESULT_CHOICES, required=False)
+    status = serializers.ChoiceField(
+        choices=PlacementProgress.STATUS_CHOICES, required=False
+    )
+    feedback = serializers.CharField(required=False, allow_blank=True)
+
+
+class BulkStageAdvanceSerializer(serializers.Serializer):
+    """
+    Input for moving many placement progress rows of one company to a stage.
+    Pass either `progress_ids` or per-row `results`.
+    """
+
+    MAX_ROWS = 1000
+
+    company = serializers.PrimaryKeyRelatedField(queryset=Company.objects.all())
+    stage = serializers.PrimaryKeyRelatedField(queryset=PlacementStage.objects.all())
+    progress_ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, max_length=MAX_ROWS
+    )
+    results = StageAdvanceEntrySerializer(many=True, required=False, max_length=MAX_ROWS)
+    status = serializers.ChoiceField(
+        choices=PlacementProgress.STATUS_CHOICES, required=False
+    )
+    result = serializers.ChoiceField(
+        choices=StageProgress.RESULT_CHOICES, default="PENDING"
+    )
+
+    def validate(self, attrs):
+        if bool(attrs.get("progress_ids")) == bool(attrs.get("results")):
+            raise serializers.ValidationError(
+                "Provide either a non-empty progress_ids list or a results list."
+            )
+        return attrs
+
+    def get_entries(self):
+        data = self.validated_data
+        if data.get("results"):
+            return [dict(entry) for entry in data["results"]]
+        return [{"progress_id": progress_id} for progress_id in data["progress_ids"]]
@@ -0,0 +1,195 @@
+"""
+Signal handlers that keep derived placement data in sync with the models.
+"""
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import caching, eligibility, search, skills, statistics
+from .models import (
+    Company,
+    ImportantDate,
+    PlacementProgress,
+    PlacementStage,
+    StageProgress,
+    Student,
+)
+
+
+def _accepted_package(company_id):
+    return (
+        Company.objects.filter(pk=company_id)
+        .values_list("package_offered", flat=True)
+        .first()
+    )
+
+
+def _progress_counters(status, company_id):
+    package = None
+    if status == statistics.ACCEPTED_STATUS:
+        package = _accepted_package(company_id)
+    return statistics.progress_counters(status, package)
+
+
+@receiver(pre_save, sender=Student)
+def remember_student_state(sender, instance, **kwargs):
+    previous = None
+    if instance.pk:
+        previous = (
+            Student.objects.filter(pk=instance.pk)
+            .values("is_placed", "branch", "skills")
+            .first()
+        )
+    instance._previous_skills = previous["skills"] if previous else None
+    instance._statistics_counters = (
+        statistics.student_counters(previous["is_placed"], previous["branch"])
+        if previous
+        else None
+    )
+
+
+@receiver(post_save, sender=Student)
+def update_student_statistics(sender, instance, **kwargs):
+    statistics.apply_deltas(
+        statistics.diff_counters(
+            getattr(instance, "_statistics_counters", None),
+            statistics.student_counters(instance.is_placed, instance.branch),
+        )
+    )
+
+
+@receiver(post_save, sender=Student)
+def update_student_skills(sender, instance, **kwargs):
+    if getattr(instance, "_previous_skills", None) != instance.skills:
+        skills.index_students([(instance.pk, instance.skills)])
+
+
+@receiver(post_delete, sender=Student)
+def remove_student_statistics(sender, instance, **kwargs):
+    statistics.apply_deltas(
+        statistics.diff_counters(
+            statistics.student_counters(instance.is_placed, instance.branch), None
+        )
+    )
+
+
+@receiver(pre_save, sender=Company)
+def remember_company_state(sender, instance, **kwargs):
+    instance._statistics_previous = None
+    if instance.pk:
+        instance._statistics_previous = (
+            Company.objects.filter(pk=instance.pk)
+            .values("is_active", "package_offered")
+            .first()
+        )
+
+
+@receiver(post_save, sender=Company)
+def update_company_statistics(sender, instance, **kwargs):
+    previous = getattr(instance, "_statistics_previous", None)
+    deltas = statistics.diff_counters(
+        statistics.company_counters(previous["is_active"]) if previous else None,
+        statistics.company_counters(instance.is_active),
+    )
+    if previous and previous["package_offered"] != instance.package_offered:
+        accepted = PlacementProgress.objects.filter(
+            company=instance, status=statistics.ACCEPTED_STATUS
+        ).count()
+        if accepted:
+            deltas[statistics.ACCEPTED_PACKAGE_SUM] = accepted * (
+                instance.package_offered - previous["package_offered"]
+            )
+    statistics.apply_deltas(deltas)
+
+
+@receiver(post_delete, sender=Company)
+def remove_company_statistics(sender, instance, **kwargs):
+    statistics.apply_deltas(
+        statistics.diff_counters(statistics.company_counters(instance.is_active), None)
+    )
+
+
+@receiver(pre_save, sender=PlacementProgress)
+def remember_progress_state(sender, instance, **kwargs):
+    previous = None
+    if instance.pk:
+        previous = (
+            PlacementProgress.objects.filter(pk=instance.pk)
+            .values("status", "company__package_offered")
+            .first()
+        )
+    instance._statistics_counters = (
+        statistics.progress_counters(
+            previous["status"], previous["company__package_offered"]
+        )
+        if previous
+        else None
+    )
+
+
+@receiver(post_save, sender=PlacementProgress)
+def update_progress_statistics(sender, instance, **kwargs):
+    statistics.apply_deltas(
+        statistics.diff_counters(
+            getattr(instance, "_statistics_counters", None),
+            _progress_counters(instance.status, instance.company_id),
+        )
+    )
+
+
+@receiver(post_delete, sender=PlacementProgress)
+def remove_progress_statistics(sender, instance, **kwargs):
+    statistics.apply_deltas(
+        statistics.diff_counters(
+            _progress_counters(instance.status, instance.company_id), None
+        )
+    )
+
+
+@receiver(post_save, sender=Company)
+def sync_company_eligibility(sender, instance, **kwargs):
+    eligibility.sync_company_branches(instance)
+    caching.bump_version("companies")
+
+
+@receiver(post_delete, sender=Company)
+def invalidate_company_caches(sender, instance, **kwargs):
+    caching.bump_version("companies")
+
+
+@receiver([post_save, post_delete], sender=PlacementStage)
+def invalidate_stage_caches(sender, instance, **kwargs):
+    caching.bump_version("stages")
+
+
+@receiver([post_save, post_delete], sender=ImportantDate)
+def invalidate_important_date_caches(sender, instance, **kwargs):
+    caching.bump_version("important_dates")
+
+
+@receiver([post_save, post_delete], sender=Student)
+def invalidate_student_caches(sender, instance, **kwargs):
+    caching.bump_version("students")
+
+
+@receiver([post_save, post_delete], sender=PlacementProgress)
+def invalidate_placement_progress_caches(sender, instance, **kwargs):
+    caching.bump_version("placement_progress")
+
+
+@receiver([post_save, post_delete], sender=StageProgress)
+def invalidate_stage_progress_caches(sender, instance, **kwargs):
+    caching.bump_version("stage_progress")
+
+
+@receiver(post_save, sender=Student)
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=ImportantDate)
+def update_search_entry(sender, instance, **kwargs):
+    search.index_objects(search.MODEL_KINDS[sender], [instance])
+
+
+@receiver(post_delete, sender=Student)
+@receiver(post_delete, sender=Company)
+@receiver(post_delete, sender=ImportantDate)
+def remove_search_entry(sender, instance, **kwargs):
+    search.remove_objects(search.MODEL_KINDS[sender], [instance.pk])
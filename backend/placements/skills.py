@@ -0,0 +1,70 @@
+"""
+Normalized skills index over the free-text `Student.skills` field.
+
+Skills are tokenized on commas into `Skill` rows, and `StudentSkill`
+links act as an inverted index so skill filters are indexed lookups
+instead of `icontains` scans.
+"""
+from django.db.models import Count
+
+from .models import Skill, StudentSkill
+
+MAX_SKILL_LENGTH = Skill._meta.get_field("name").max_length
+
+
+def tokenize(text):
+    """Split a comma-separated skills string into unique normalized names"""
+    skills = []
+    for skill in (text or "").split(","):
+        skill = " ".join(skill.split()).lower()[:MAX_SKILL_LENGTH]
+        if skill and skill not in skills:
+            skills.append(skill)
+    return skills
+
+
+def _skill_ids(names):
+    """Map skill names to ids, creating the missing ones in bulk"""
+    if not names:
+        return {}
+    Skill.objects.bulk_create(
+        [Skill(name=name) for name in names], ignore_conflicts=True, batch_size=500
+    )
+    return dict(Skill.objects.filter(name__in=names).values_list("name", "id"))
+
+
+def index_students(rows):
+    """
+    Rebuild the skill links of the given students.
+    `rows` is an iterable of (student_id, skills_text) pairs.
+    """
+    tokens = {student_id: tokenize(text) for student_id, text in rows}
+    if not tokens:
+        return 0
+
+    skill_ids = _skill_ids({name for names in tokens.values() for name in names})
+    StudentSkill.objects.filter(student_id__in=list(tokens)).delete()
+    links = StudentSkill.objects.bulk_create(
+        [
+            StudentSkill(student_id=student_id, skill_id=skill_ids[name])
+            for student_id, names in tokens.items()
+            for name in names
+        ],
+        batch_size=1000,
+    )
+    return len(links)
+
+
+def filter_by_skills(queryset, names, match_all=True):
+    """Students having all (or, with match_all=False, any) of `names`"""
+    names = tokenize(",".join(names))
+    if not names:
+        return queryset
+
+    links = StudentSkill.objects.filter(skill__name__in=names)
+    if match_all:
+        links = (
+            links.values("student_id")
+            .annotate(matched=Count("skill_id"))
+            .filter(matched=len(names))
+        )
+    return queryset.filter(id__in=links.values("student_id"))
@@ -0,0 +1,200 @@
+"""
+Persisted placement statistics snapshot.
+
+The dashboard statistics used to be computed with a handful of COUNT/AVG
+queries on every request. They are now stored as counters in
+`PlacementStatistic` and adjusted by deltas whenever a Student, Company or
+PlacementProgress row changes, so reading them is a single query.
+"""
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from .models import Company, PlacementProgress, PlacementStatistic, Student
+
+TOTAL_STUDENTS = "students.total"
+PLACED_STUDENTS = "students.placed"
+BRANCH_PLACED_PREFIX = "students.placed.branch."
+ACTIVE_COMPANIES = "companies.active"
+TOTAL_APPLICATIONS = "applications.total"
+STATUS_PREFIX = "applications.status."
+ACCEPTED_PACKAGE_SUM = "applications.accepted_package_sum"
+
+ACCEPTED_STATUS = "OFFER_ACCEPTED"
+
+
+def student_counters(is_placed, branch):
+    """Counters a single student contributes to the snapshot"""
+    return {
+        TOTAL_STUDENTS: 1,
+        PLACED_STUDENTS: int(is_placed),
+        BRANCH_PLACED_PREFIX + branch: int(is_placed),
+    }
+
+
+def company_counters(is_active):
+    """Counters a single company contributes to the snapshot"""
+    return {ACTIVE_COMPANIES: int(is_active)}
+
+
+def progress_counters(status, package):
+    """Counters a single placement progress row contributes to the snapshot"""
+    return {
+        TOTAL_APPLICATIONS: 1,
+        STATUS_PREFIX + status: 1,
+        ACCEPTED_PACKAGE_SUM: (package or 0) if status == ACCEPTED_STATUS else 0,
+    }
+
+
+def diff_counters(old, new):
+    """Return the deltas that turn the `old` contribution into `new`"""
+    old = old or {}
+    new = new or {}
+    deltas = {}
+    for key in set(old) | set(new):
+        delta = new.get(key, 0) - old.get(key, 0)
+        if delta:
+            deltas[key] = delta
+    return deltas
+
+
+def _empty_counters():
+    counters = {
+        TOTAL_STUDENTS: Decimal(0),
+        PLACED_STUDENTS: Decimal(0),
+        ACTIVE_COMPANIES: Decimal(0),
+        TOTAL_APPLICATIONS: Decimal(0),
+        ACCEPTED_PACKAGE_SUM: Decimal(0),
+    }
+    for branch, _ in Student.BRANCH_CHOICES:
+        counters[BRANCH_PLACED_PREFIX + branch] = Decimal(0)
+    for status, _ in PlacementProgress.STATUS_CHOICES:
+        counters[STATUS_PREFIX + status] = Decimal(0)
+    return counters
+
+
+def placed_by_branch():
+    """Placed student count of each branch with any placed students"""
+    return (
+        Student.objects.filter(is_placed=True)
+        .order_by()
+        .values("branch")
+        .annotate(count=Count("id"))
+    )
+
+
+def compute_live_counters():
+    """Compute every counter from the live tables"""
+    counters = _empty_counters()
+
+    students = Student.objects.aggregate(
+        total=Count("id"), placed=Count("id", filter=Q(is_placed=True))
+    )
+    counters[TOTAL_STUDENTS] = Decimal(students["total"])
+    counters[PLACED_STUDENTS] = Decimal(students["placed"])
+
+    for row in placed_by_branch():
+        counters[BRANCH_PLACED_PREFIX + row["branch"]] = Decimal(row["count"])
+
+    counters[ACTIVE_COMPANIES] = Decimal(Company.objects.filter(is_active=True).count())
+
+    status_breakdown = (
+        PlacementProgress.objects.order_by().values("status").annotate(count=Count("id"))
+    )
+    for row in status_breakdown:
+        counters[STATUS_PREFIX + row["status"]] = Decimal(row["count"])
+        counters[TOTAL_APPLICATIONS] += row["count"]
+
+    accepted = PlacementProgress.objects.filter(status=ACCEPTED_STATUS).aggregate(
+        total=Sum("company__package_offered")
+    )
+    counters[ACCEPTED_PACKAGE_SUM] = accepted["total"] or Decimal(0)
+    return counters
+
+
+@transaction.atomic
+def rebuild_snapshot():
+    """Replace the stored snapshot with freshly computed counters"""
+    counters = compute_live_counters()
+    now = timezone.now()
+    PlacementStatistic.objects.exclude(key__in=list(counters)).delete()
+    PlacementStatistic.objects.bulk_create(
+        [
+            PlacementStatistic(key=key, value=value, updated_at=now)
+            for key, value in counters.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["key"],
+        update_fields=["value", "updated_at"],
+    )
+    return counters
+
+
+def read_counters():
+    """Read the stored snapshot, building it first if it does not exist yet"""
+    counters = dict(PlacementStatistic.objects.values_list("key", "value"))
+    if TOTAL_STUDENTS not in counters:
+        counters = rebuild_snapshot()
+    return counters
+
+
+def apply_deltas(deltas):
+    """
+    Atomically add `deltas` to the stored counters. Nothing is written until
+    the snapshot has been built once; the first read builds it from scratch.
+    """
+    now = timezone.now()
+    for key, delta in deltas.items():
+        if not delta:
+            continue
+        updated = PlacementStatistic.objects.filter(key=key).update(
+            value=F("value") + delta, updated_at=now
+        )
+        if not updated and PlacementStatistic.objects.filter(key=TOTAL_STUDENTS).exists():
+            # A counter for a value outside the declared choices
+            PlacementStatistic.objects.get_or_create(key=key)
+            PlacementStatistic.objects.filter(key=key).update(
+                value=F("value") + delta, updated_at=now
+            )
+
+
+def format_statistics(counters):
+    """Shape the counters like the /placement-progress/statistics/ response"""
+    total_students = int(counters.get(TOTAL_STUDENTS, 0))
+    placed_students = int(counters.get(PLACED_STUDENTS, 0))
+    offers_accepted = int(counters.get(STATUS_PREFIX + ACCEPTED_STATUS, 0))
+    package_sum = counters.get(ACCEPTED_PACKAGE_SUM, 0)
+    avg_package = package_sum / offers_accepted if offers_accepted else 0
+
+    status_breakdown = [
+        {"status": key[len(STATUS_PREFIX):], "count": int(value)}
+        for key, value in sorted(counters.items())
+        if key.startswith(STATUS_PREFIX) and value
+    ]
+    branch_stats = [
+        {"branch": key[len(BRANCH_PLACED_PREFIX):], "count": int(value)}
+        for key, value in sorted(counters.items())
+        if key.startswith(BRANCH_PLACED_PREFIX) and value
+    ]
+
+    return {
+        "total_students": total_students,
+        "placed_students": placed_students,
+        "placement_percentage": round((placed_students / total_students * 100), 2)
+        if total_students > 0
+        else 0,
+        "total_companies": int(counters.get(ACTIVE_COMPANIES, 0)),
+        "total_applications": int(counters.get(TOTAL_APPLICATIONS, 0)),
+        "offers_received": int(counters.get(STATUS_PREFIX + "OFFER_RECEIVED", 0)),
+        "offers_accepted": offers_accepted,
+        "average_package": round(avg_package, 2),
+        "status_breakdown": status_breakdown,
+        "branch_wise_placement": branch_stats,
+    }
+
+
+def get_statistics():
+    """Statistics payload read from the snapshot"""
+    return format_statistics(read_counters())
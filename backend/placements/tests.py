@@ -0,0 +1,171 @@
+import io
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from . import jobs
+from .management.commands.check_query_plans import hot_querysets
+from .models import (
+    Company,
+    PlacementProgress,
+    PlacementStage,
+    StageProgress,
+    Student,
+    StudentImportJob,
+)
+
+User = get_user_model()
+
+
+# DEBUG is off under manage.py test, which would redirect every request to HTTPS
+@override_settings(SECURE_SSL_REDIRECT=False)
+class QueryCountTests(APITestCase):
+    """Endpoints load related rows in a fixed number of queries"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user("admin", "admin@example.com", "pw", role="ADMIN")
+        cls.stages = [
+            PlacementStage.objects.create(
+                name=f"Round {order}", stage_type="TECHNICAL1", sequence_order=order
+            )
+            for order in (1, 2)
+        ]
+        cls.company = cls.create_company("Acme")
+        cls.student_user = User.objects.create_user(
+            "e00000", "e00000@example.com", "pw", role="STUDENT"
+        )
+        cls.student = cls.create_student("E00000", user=cls.student_user)
+        cls.create_progress(cls.student, cls.company)
+
+    @classmethod
+    def create_company(cls, name):
+        return Company.objects.create(
+            name=name,
+            description="Product company",
+            company_type="PRODUCT",
+            package_offered=12,
+            min_cgpa_required=7,
+            eligible_branches="CSE,IT",
+            job_role="Software Engineer",
+            job_location="Pune",
+            contact_person="HR",
+            contact_email=f"hr@{name.lower()}.example.com",
+            contact_phone="9000000000",
+        )
+
+    @classmethod
+    def create_student(cls, enrollment_number, user=None):
+        return Student.objects.create(
+            user=user,
+            enrollment_number=enrollment_number,
+            name=f"Student {enrollment_number}",
+            email=f"{enrollment_number.lower()}@example.com",
+            phone="9000000000",
+            branch="CSE",
+            year="4",
+            cgpa=8,
+            skills="Python, SQL",
+        )
+
+    @classmethod
+    def create_progress(cls, student, company):
+        progress = PlacementProgress.objects.create(
+            student=student, company=company, current_stage=cls.stages[-1]
+        )
+        for stage in cls.stages:
+            StageProgress.objects.create(placement_progress=progress, stage=stage, result="CLEARED")
+        return progress
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.admin)
+
+    def add_students(self, count):
+        """More applicants to the shared company"""
+        for _ in range(count):
+            student = self.create_student(f"E{Student.objects.count() + 1:05d}")
+            self.create_progress(student, self.company)
+
+    def add_applications(self, count):
+        """More applications of the shared student"""
+        for _ in range(count):
+            company = self.create_company(f"Company{Company.objects.count() + 1}")
+            self.create_progress(self.student, company)
+
+    def assert_flat_queries(self, url, expected, grow=None):
+        for count in (2, 6):
+            (grow or self.add_students)(count)
+            cache.clear()
+            with self.assertNumQueries(expected):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+
+    def test_placement_progress_list(self):
+        self.assert_flat_queries("/api/placement-progress/", 4)
+
+    def test_students_list(self):
+        self.assert_flat_queries("/api/students/", 3)
+
+    def test_recent_updates(self):
+        self.assert_flat_queries("/api/placement-progress/recent_updates/", 2)
+
+    def test_company_applicants(self):
+        self.assert_flat_queries(f"/api/companies/{self.company.pk}/applicants/", 3)
+
+    def test_placement_history(self):
+        self.assert_flat_queries(
+            f"/api/students/{self.student.pk}/placement_history/", 3, self.add_applications
+        )
+
+    def test_my_progress(self):
+        self.client.force_authenticate(self.student_user)
+        self.assert_flat_queries("/api/placement-progress/my_progress/", 3, self.add_applications)
+
+    def test_student_detail(self):
+        self.assert_flat_queries(f"/api/students/{self.student.pk}/", 2, self.add_applications)
+
+    def test_placement_progress_detail(self):
+        progress = self.student.placements.first()
+        self.assert_flat_queries(f"/api/placement-progress/{progress.pk}/", 3)
+
+
+class StaleJobTests(TestCase):
+    """Only running jobs that stopped reporting progress are requeued"""
+
+    def create_running_job(self, started, updated):
+        job = StudentImportJob.objects.create(file_name="students.csv", status="RUNNING")
+        StudentImportJob.objects.filter(pk=job.pk).update(
+            started_at=timezone.now() - started, updated_at=timezone.now() - updated
+        )
+        return job
+
+    def test_requeues_silent_jobs_only(self):
+        silent = self.create_running_job(timedelta(hours=2), timedelta(hours=1))
+        busy = self.create_running_job(timedelta(hours=2), timedelta(minutes=1))
+        self.assertEqual(jobs.requeue_stale_jobs(timedelta(minutes=30)), 1)
+        silent.refresh_from_db()
+        busy.refresh_from_db()
+        self.assertEqual(silent.status, "PENDING")
+        self.assertEqual(busy.status, "RUNNING")
+
+
+@skipUnless(connection.vendor == "sqlite", "Plan checks read SQLite query plans")
+class QueryPlanTests(TestCase):
+    """Hot querysets keep using their indexes"""
+
+    def test_hot_querysets_use_indexes(self):
+        # Raises CommandError on any full scan or unindexed sort
+        call_command("check_query_plans", stdout=io.StringIO())
+
+    def test_placed_filters_use_partial_indexes(self):
+        plans = {name: queryset.explain() for name, queryset in hot_querysets()}
+        self.assertIn("student_placed_branch_idx", plans["placed students by branch"])
+        self.assertIn("student_unplaced_branch_idx", plans["unplaced students by branch"])
@@ -0,0 +1,129 @@
+"""
+Bulk stage transitions for a placement drive.
+
+Moving a round's candidates to the next stage used to take one PATCH per
+PlacementProgress and one POST per StageProgress. `advance_stage` does the
+whole batch in one transaction with bulk writes. Bulk writes skip the model
+signals, so the statistics deltas and cache versions those signals maintain
+are applied here directly.
+"""
+from collections import Counter
+
+from django.db import transaction
+from django.utils import timezone
+
+from . import caching, statistics
+from .models import PlacementProgress, StageProgress
+
+UPDATED = "updated"
+FAILED = "error"
+
+
+def _outcome(progress_id, outcome, **extra):
+    return {"progress_id": progress_id, "outcome": outcome, **extra}
+
+
+@transaction.atomic
+def advance_stage(company, stage, entries, status=None, result="PENDING"):
+    """
+    Move the placement progress rows in `entries` to `stage`.
+
+    `entries` is a list of dicts with a `progress_id` and optional `result`,
+    `feedback` and `status` overriding the batch-wide `result`/`status`.
+    Rows that do not exist or belong to another company are reported and
+    skipped; the rest are written. Returns one outcome per entry, in order.
+    """
+    now = timezone.now()
+    ids = [entry["progress_id"] for entry in entries]
+    progresses = PlacementProgress.objects.select_for_update().in_bulk(ids)
+    stage_rows = {
+        row.placement_progress_id: row
+        for row in StageProgress.objects.filter(
+            placement_progress_id__in=ids, stage=stage
+        )
+    }
+
+    report = []
+    seen = set()
+    deltas = Counter()
+    changed_progress = []
+    changed_stage_rows = []
+    new_stage_rows = []
+
+    for entry in entries:
+        progress_id = entry["progress_id"]
+        progress = progresses.get(progress_id)
+        if progress is None:
+            report.append(_outcome(progress_id, FAILED, error="Placement progress not found"))
+            continue
+        if progress.company_id != company.pk:
+            report.append(
+                _outcome(progress_id, FAILED, error="Placement progress belongs to another company")
+            )
+            continue
+        if progress_id in seen:
+            report.append(_outcome(progress_id, FAILED, error="Duplicate progress id"))
+            continue
+        seen.add(progress_id)
+
+        new_status = entry.get("status") or status or progress.status
+        if new_status != progress.status:
+            deltas.update(
+                statistics.diff_counters(
+                    statistics.progress_counters(progress.status, company.package_offered),
+                    statistics.progress_counters(new_status, company.package_offered),
+                )
+            )
+        progress.status = new_status
+        progress.current_stage = stage
+        progress.updated_at = now
+        changed_progress.append(progress)
+
+        stage_result = entry.get("result") or result
+        stage_row = stage_rows.get(progress_id)
+        created = stage_row is None
+        if created:
+            stage_row = StageProgress(
+                placement_progress=progress,
+                stage=stage,
+                created_at=now,
+            )
+            new_stage_rows.append(stage_row)
+        else:
+            changed_stage_rows.append(stage_row)
+        stage_row.result = stage_result
+        stage_row.updated_at = now
+        if "feedback" in entry:
+            stage_row.feedback = entry["feedback"]
+        if stage_result != "PENDING" and stage_row.completed_date is None:
+            stage_row.completed_date = now
+
+        report.append(
+            _outcome(
+                progress_id,
+                UPDATED,
+                status=new_status,
+                result=stage_result,
+                created_stage_progress=created,
+            )
+        )
+
+    if changed_progress:
+        PlacementProgress.objects.bulk_update(
+            changed_progress, ["current_stage", "status", "updated_at"], batch_size=500
+        )
+    if changed_stage_rows:
+        StageProgress.objects.bulk_update(
+            changed_stage_rows,
+            ["result", "feedback", "completed_date", "updated_at"],
+            batch_size=500,
+        )
+    if new_stage_rows:
+        StageProgress.objects.bulk_create(new_stage_rows, batch_size=500)
+
+    statistics.apply_deltas(dict(deltas))
+    if changed_progress:
+        transaction.on_commit(
+            lambda: caching.bump_version("placement_progress", "stage_progress")
+        )
+    return report
@@ -0,0 +1,182 @@
+"""
+Daily placement trend snapshots.
+
+`take_snapshot` writes one `PlacementTrend` row per branch for today. After
+the first run it only re-aggregates branches with students, applications
+or accepted-offer companies changed since the previous run, and copies
+the other branches forward.
+
+Rows that change branch or get deleted leave no trace in `updated_at`.
+Both can only make a copied branch over-count, never under-count, so the
+copied totals are checked against the live statistics snapshot. If
+students or applications do not add up, every branch is re-aggregated.
+"""
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from . import statistics
+from .models import PlacementProgress, PlacementTrend, Student
+
+# Longest range /statistics/trend/ serves in one response
+MAX_TREND_DAYS = 366
+
+OFFER_STATUSES = ["OFFER_RECEIVED", "OFFER_ACCEPTED", "OFFER_DECLINED"]
+
+VALUE_FIELDS = [
+    "total_students",
+    "placed_students",
+    "applications",
+    "offers",
+    "offers_accepted",
+    "accepted_package_sum",
+]
+
+
+def _empty_values():
+    values = dict.fromkeys(VALUE_FIELDS, 0)
+    values["accepted_package_sum"] = Decimal(0)
+    return values
+
+
+def branch_aggregates(branches=None):
+    """Live trend values per branch, for every branch or only `branches`"""
+    students = Student.objects.order_by()
+    progress = PlacementProgress.objects.order_by()
+    if branches is None:
+        branches = [branch for branch, _ in Student.BRANCH_CHOICES]
+    else:
+        students = students.filter(branch__in=branches)
+        progress = progress.filter(student__branch__in=branches)
+    values = {branch: _empty_values() for branch in branches}
+
+    student_rows = students.values("branch").annotate(
+        total=Count("id"), placed=Count("id", filter=Q(is_placed=True))
+    )
+    for row in student_rows:
+        branch_values = values.setdefault(row["branch"], _empty_values())
+        branch_values["total_students"] = row["total"]
+        branch_values["placed_students"] = row["placed"]
+
+    accepted = Q(status=statistics.ACCEPTED_STATUS)
+    progress_rows = progress.values("student__branch").annotate(
+        applications=Count("id"),
+        offers=Count("id", filter=Q(status__in=OFFER_STATUSES)),
+        offers_accepted=Count("id", filter=accepted),
+        package_sum=Sum("company__package_offered", filter=accepted),
+    )
+    for row in progress_rows:
+        branch_values = values.setdefault(row["student__branch"], _empty_values())
+        branch_values["applications"] = row["applications"]
+        branch_values["offers"] = row["offers"]
+        branch_values["offers_accepted"] = row["offers_accepted"]
+        branch_values["accepted_package_sum"] = row["package_sum"] or Decimal(0)
+    return values
+
+
+def changed_branches(since):
+    """Branches whose trend values may have changed after `since`"""
+    querysets = [
+        Student.objects.filter(updated_at__gt=since).values_list("branch", flat=True),
+        PlacementProgress.objects.filter(updated_at__gt=since).values_list(
+            "student__branch", flat=True
+        ),
+        # A new package changes the sum without touching the progress rows
+        PlacementProgress.objects.filter(
+            status=statistics.ACCEPTED_STATUS, company__updated_at__gt=since
+        ).values_list("student__branch", flat=True),
+    ]
+    branches = set()
+    for queryset in querysets:
+        branches.update(queryset.order_by().distinct())
+    return branches
+
+
+def _totals_match(values):
+    counters = statistics.read_counters()
+    return sum(v["total_students"] for v in values.values()) == counters.get(
+        statistics.TOTAL_STUDENTS, 0
+    ) and sum(v["applications"] for v in values.values()) == counters.get(
+        statistics.TOTAL_APPLICATIONS, 0
+    )
+
+
+@transaction.atomic
+def take_snapshot(full=False):
+    """
+    Write today's snapshot. Returns (date, recomputed), where `recomputed`
+    is the set of re-aggregated branches, or None if all of them were.
+    """
+    started = timezone.now()
+    today = timezone.localdate(started)
+
+    latest = PlacementTrend.objects.order_by("-date").values_list("date", flat=True).first()
+    previous = list(PlacementTrend.objects.filter(date=latest)) if latest else []
+
+    recomputed = None
+    if full or not previous:
+        values = branch_aggregates()
+    else:
+        since = max(row.computed_at for row in previous)
+        recomputed = changed_branches(since)
+        values = {
+            row.branch: {field: getattr(row, field) for field in VALUE_FIELDS}
+            for row in previous
+        }
+        if recomputed:
+            values.update(branch_aggregates(recomputed))
+        if not _totals_match(values):
+            values = branch_aggregates()
+            recomputed = None
+
+    PlacementTrend.objects.filter(date=today).exclude(branch__in=list(values)).delete()
+    PlacementTrend.objects.bulk_create(
+        [
+            PlacementTrend(date=today, branch=branch, computed_at=started, **branch_values)
+            for branch, branch_values in values.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["date", "branch"],
+        update_fields=VALUE_FIELDS + ["computed_at"],
+    )
+    return today, recomputed
+
+
+def _format_values(values):
+    total = values["total_students"]
+    accepted = values["offers_accepted"]
+    return {
+        "total_students": total,
+        "placed_students": values["placed_students"],
+        "placement_percentage": round(values["placed_students"] / total * 100, 2)
+        if total
+        else 0,
+        "applications": values["applications"],
+        "offers": values["offers"],
+        "offers_accepted": accepted,
+        "average_package": round(values["accepted_package_sum"] / accepted, 2)
+        if accepted
+        else 0,
+    }
+
+
+def get_trend(date_from, date_to, branch=None):
+    """One entry per snapshot day in the range, with totals and per-branch values"""
+    rows = PlacementTrend.objects.filter(date__range=(date_from, date_to))
+    if branch:
+        rows = rows.filter(branch=branch)
+
+    days = {}
+    for row in rows.order_by("date", "branch"):
+        day = days.setdefault(row.date, {"totals": _empty_values(), "branches": []})
+        row_values = {field: getattr(row, field) for field in VALUE_FIELDS}
+        for field in VALUE_FIELDS:
+            day["totals"][field] += row_values[field]
+        day["branches"].append({"branch": row.branch, **_format_values(row_values)})
+
+    return [
+        {"date": date, **_format_values(day["totals"]), "branches": day["branches"]}
+        for date, day in days.items()
+    ]
@@ -2,7 +2,8 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import (
     StudentViewSet, CompanyViewSet, PlacementStageViewSet,
-    PlacementProgressViewSet, StageProgressViewSet, ImportantDateViewSet
+    PlacementProgressViewSet, StageProgressViewSet, ImportantDateViewSet,
+    SearchView, DashboardView
 )
 
 router = DefaultRouter()
@@ -14,5 +15,7 @@ router.register(r'stage-progress', StageProgressViewSet)
 router.register(r'important-dates', ImportantDateViewSet)
 
 urlpatterns = [
+    path('search/', SearchView.as_view(), name='search'),
+    path('dashboard/', DashboardView.as_view(), name='dashboard'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -1,13 +1,28 @@
+import time
+from datetime import timedelta
+
 from accounts.permissions import IsAdmin, IsAdminOrReadOnly, IsOwnerOrAdmin, IsStudent
-from django.db.models import Avg, Count, Q
-from django.db import models
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.filters import SearchFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-import csv
-import io
-
+from rest_framework.views import APIView
+
+from . import search
+from .caching import cached_response
+from .conditional import ConditionalGetMixin, conditional_get, make_etag, probe
+from .dashboard import build_dashboard, server_timing
+from .eligibility import cached_eligible_companies, eligible_students
+from .exports import ExportMixin
+from .fast_serializers import FastListMixin
+from .filters import SkillsFilterBackend, StableOrderingFilter, StudentFilterBackend
+from .funnel import compute_funnels, get_funnel
+from .importers import StudentCSVImporter
+from .jobs import enqueue_student_import
 from .models import (
     Company,
     ImportantDate,
@@ -15,21 +30,84 @@ from .models import (
     PlacementStage,
     StageProgress,
     Student,
+    PlacementStatistic,
+    PlacementTrend,
+    StudentImportJob,
+)
+from .pagination import (
+    PlacementProgressCursorPagination,
+    SelectablePaginationMixin,
+    StudentCursorPagination,
 )
+from .scoping import can_see_all, get_student_id, scope_queryset
 from .serializers import (
+    BulkStageAdvanceSerializer,
     CompanySerializer,
     ImportantDateSerializer,
     PlacementProgressSerializer,
     PlacementStageSerializer,
     StageProgressSerializer,
+    StudentImportJobSerializer,
     StudentSerializer,
 )
+from .statistics import get_statistics
+from .transitions import advance_stage
+from .trends import MAX_TREND_DAYS, get_trend
+
+
+class PrefetchViewMixin:
+    """
+    Apply the serializer's select_related/prefetch plan to every queryset the
+    viewset hands out, so list, detail and custom actions all load related
+    rows in a fixed number of queries
+    """
+
+    def get_queryset(self):
+        return self.eager_load(super().get_queryset())
+
+    def eager_load(self, queryset, serializer_class=None):
+        if serializer_class is not None:
+            return serializer_class.setup_eager_loading(queryset)
+        # Only the viewset's own serializer honours ?fields= / ?expand=
+        serializer_class = self.get_serializer_class()
+        return serializer_class.setup_eager_loading(
+            queryset, serializer_class.requested_fields(self.request)
+        )
 
 
-class StudentViewSet(viewsets.ModelViewSet):
+class StudentViewSet(
+    ConditionalGetMixin,
+    FastListMixin,
+    ExportMixin,
+    SelectablePaginationMixin,
+    PrefetchViewMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Student.objects.all()
     serializer_class = StudentSerializer
     permission_classes = [IsAuthenticated]
+    filter_backends = [
+        StudentFilterBackend,
+        SkillsFilterBackend,
+        SearchFilter,
+        StableOrderingFilter,
+    ]
+    # Prefix matches only, so the search can use an index
+    search_fields = ["^name", "^enrollment_number", "^email"]
+    ordering_fields = [
+        "name",
+        "enrollment_number",
+        "branch",
+        "year",
+        "cgpa",
+        "created_at",
+        "updated_at",
+    ]
+    ordering = ["-created_at", "-id"]
+    cursor_pagination_class = StudentCursorPagination
+    export_filename = "students"
+    # Extra filters applied by the alias actions below
+    fixed_filters = {}
 
     def get_permissions(self):
         """
@@ -38,19 +116,18 @@ class StudentViewSet(viewsets.ModelViewSet):
         """
         if self.action in ["create", "update", "partial_update", "destroy"]:
             return [IsAdmin()]
-        return [IsAuthenticated()]
+        # Falls back to the action's own permission_classes, if any
+        return super().get_permissions()
 
     def get_queryset(self):
         """
         Students can only see their own profile
         Admins can see all students
         """
-        user = self.request.user
-        if user.is_admin or user.is_staff:
-            return Student.objects.all()
-        elif user.is_student:
-            return Student.objects.filter(user=user)
-        return Student.objects.none()
+        return self.eager_load(scope_queryset(self.request, Student.objects.all(), "pk"))
+
+    def filter_queryset(self, queryset):
+        return super().filter_queryset(queryset).filter(**self.fixed_filters)
 
     def perform_create(self, serializer):
         """Link student to current user if they are a student"""
@@ -61,29 +138,46 @@ class StudentViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["get"])
     def placed_students(self, request):
-        """Get all placed students"""
-        placed = self.queryset.filter(is_placed=True)
-        serializer = self.get_serializer(placed, many=True)
-        return Response(serializer.data)
+        """Get all placed students (same as the list with ?is_placed=true)"""
+        self.fixed_filters = {"is_placed": True}
+        return self.list(request)
 
     @action(detail=False, methods=["get"])
     def unplaced_students(self, request):
-        """Get all unplaced students"""
-        unplaced = self.queryset.filter(is_placed=False)
-        serializer = self.get_serializer(unplaced, many=True)
-        return Response(serializer.data)
+        """Get all unplaced students (same as the list with ?is_placed=false)"""
+        self.fixed_filters = {"is_placed": False}
+        return self.list(request)
 
     @action(detail=True, methods=["get"])
     def placement_history(self, request, pk=None):
         """Get placement history for a specific student"""
         student = self.get_object()
-        placements = PlacementProgress.objects.filter(student=student)
+        placements = self.eager_load(
+            PlacementProgress.objects.filter(student=student),
+            PlacementProgressSerializer,
+        )
         serializer = PlacementProgressSerializer(placements, many=True)
         return Response(serializer.data)
 
+    @action(detail=True, methods=["get"])
+    def eligible_companies(self, request, pk=None):
+        """Get active companies this student meets the branch and CGPA criteria for"""
+        student = self.get_object()
+        data = cached_eligible_companies(
+            student.branch,
+            student.cgpa,
+            lambda companies: CompanySerializer(
+                self.eager_load(companies, CompanySerializer), many=True
+            ).data,
+        )
+        return Response(data)
+
     @action(detail=False, methods=["post"], permission_classes=[IsAdmin])
     def upload_csv(self, request):
-        """Upload students from CSV file"""
+        """
+        Upload students from CSV file
+        Pass async=true to queue the import and get a job id back right away
+        """
         if 'file' not in request.FILES:
             return Response(
                 {"error": "No file provided"}, 
@@ -99,121 +193,156 @@ class StudentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        run_async = request.query_params.get("async", request.data.get("async", ""))
+        if str(run_async).lower() in ["1", "true", "yes"]:
+            job = enqueue_student_import(csv_file, request.user)
+            return Response({
+                "message": "CSV queued for import",
+                "job_id": job.id,
+                "status": job.status,
+                "status_url": request.build_absolute_uri(
+                    reverse("student-import-job", kwargs={"job_id": job.id})
+                ),
+            }, status=status.HTTP_202_ACCEPTED)
+        
+        importer = StudentCSVImporter()
         try:
-            # Read and decode the file
-            decoded_file = csv_file.read().decode('utf-8')
-            io_string = io.StringIO(decoded_file)
-            reader = csv.DictReader(io_string)
-            
-            created_count = 0
-            updated_count = 0
-            errors = []
-            
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is 1)
-                try:
-                    enrollment_number = row.get('enrollment_number', '').strip()
-                    if not enrollment_number:
-                        errors.append(f"Row {row_num}: Missing enrollment_number")
-                        continue
-                    
-                    # Check if student exists
-                    student, created = Student.objects.update_or_create(
-                        enrollment_number=enrollment_number,
-                        defaults={
-                            'name': row.get('name', '').strip(),
-                            'email': row.get('email', '').strip(),
-                            'phone': row.get('phone', '').strip(),
-                            'branch': row.get('branch', '').strip(),
-                            'year': row.get('year', '').strip(),
-                            'cgpa': float(row.get('cgpa', 0)),
-                            'skills': row.get('skills', '').strip(),
-                            'is_placed': row.get('is_placed', 'FALSE').strip().upper() == 'TRUE',
-                        }
-                    )
-                    
-                    if created:
-                        created_count += 1
-                    else:
-                        updated_count += 1
-                        
-                except Exception as e:
-                    errors.append(f"Row {row_num}: {str(e)}")
+            report = importer.run(csv_file)
             
             return Response({
                 "message": "CSV processed successfully",
-                "created": created_count,
-                "updated": updated_count,
-                "errors": errors
+                **report,
             }, status=status.HTTP_200_OK)
             
         except Exception as e:
+            # Rows from batches written before the failure stay imported
             return Response(
-                {"error": f"Error processing CSV: {str(e)}"}, 
+                {"error": f"Error processing CSV: {str(e)}", **importer.report()}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"import-jobs/(?P<job_id>\d+)",
+        permission_classes=[IsAdmin],
+    )
+    def import_job(self, request, job_id=None):
+        """Get progress, row counts and errors of a queued CSV import"""
+        try:
+            job = StudentImportJob.objects.defer("payload").get(pk=job_id)
+        except StudentImportJob.DoesNotExist:
+            return Response(
+                {"error": "Import job not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(StudentImportJobSerializer(job).data)
+
 
-class CompanyViewSet(viewsets.ModelViewSet):
+# Everything a stage funnel is counted from
+FUNNEL_VERSIONS = ("companies", "stages", "placement_progress", "stage_progress")
+
+
+class CompanyViewSet(ConditionalGetMixin, PrefetchViewMixin, viewsets.ModelViewSet):
     queryset = Company.objects.all()
     serializer_class = CompanySerializer
     permission_classes = [IsAdminOrReadOnly]
 
+    @conditional_get("get_list_validators")
+    @cached_response("companies")
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    def get_active_queryset(self):
+        return self.queryset.filter(is_active=True)
+
     @action(detail=False, methods=["get"])
+    @cached_response("companies")
     def active_companies(self, request):
         """Get all active companies"""
-        active = self.queryset.filter(is_active=True)
+        active = self.eager_load(self.get_active_queryset())
         serializer = self.get_serializer(active, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=["get"], url_path="funnel")
+    @cached_response(*FUNNEL_VERSIONS)
+    def funnels(self, request):
+        """Get the stage funnel of every company with applicants"""
+        return Response(compute_funnels())
+
+    @action(detail=True, methods=["get"])
+    @cached_response(*FUNNEL_VERSIONS)
+    def funnel(self, request, pk=None):
+        """Get how many applicants reached, cleared and failed each stage"""
+        return Response(get_funnel(self.get_object()))
+
     @action(detail=True, methods=["get"])
     def applicants(self, request, pk=None):
         """Get all applicants for a specific company"""
         company = self.get_object()
-        placements = PlacementProgress.objects.filter(company=company)
+        placements = self.eager_load(
+            PlacementProgress.objects.filter(company=company),
+            PlacementProgressSerializer,
+        )
         serializer = PlacementProgressSerializer(placements, many=True)
         return Response(serializer.data)
 
+    @action(detail=True, methods=["get"], permission_classes=[IsAdmin])
+    def eligible_students(self, request, pk=None):
+        """Get students who meet a company's branch and CGPA criteria"""
+        company = self.get_object()
+        students = self.eager_load(eligible_students(company), StudentSerializer)
+        page = self.paginate_queryset(students)
+        if page is not None:
+            serializer = StudentSerializer(page, many=True, context=self.get_serializer_context())
+            return self.get_paginated_response(serializer.data)
+        serializer = StudentSerializer(students, many=True, context=self.get_serializer_context())
+        return Response(serializer.data)
+
 
-class PlacementStageViewSet(viewsets.ModelViewSet):
+class PlacementStageViewSet(ConditionalGetMixin, PrefetchViewMixin, viewsets.ModelViewSet):
     queryset = PlacementStage.objects.all()
     serializer_class = PlacementStageSerializer
     permission_classes = [IsAdminOrReadOnly]
-
-
-class PlacementProgressViewSet(viewsets.ModelViewSet):
+    # No updated_at column; edits are tracked by the "stages" version instead
+    conditional_versions = ("stages",)
+    conditional_timestamp_field = None
+
+    @conditional_get("get_list_validators")
+    @cached_response("stages")
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+
+class PlacementProgressViewSet(
+    ConditionalGetMixin,
+    FastListMixin,
+    ExportMixin,
+    SelectablePaginationMixin,
+    PrefetchViewMixin,
+    viewsets.ModelViewSet,
+):
     queryset = PlacementProgress.objects.all()
     serializer_class = PlacementProgressSerializer
     permission_classes = [IsAuthenticated]
+    cursor_pagination_class = PlacementProgressCursorPagination
+    export_filename = "placement-progress"
+    conditional_versions = ("students", "companies", "stages", "stage_progress")
 
     def get_queryset(self):
         """
         Students can only see their own placement progress
         Admins can see all
         """
-        user = self.request.user
-        if user.is_admin or user.is_staff:
-            return PlacementProgress.objects.all()
-        elif user.is_student:
-            if hasattr(user, "student_profile") and user.student_profile:
-                return PlacementProgress.objects.filter(student=user.student_profile)
-            else:
-                # Student user exists but no student profile linked
-                # Try to find student by email or username
-                student = Student.objects.filter(
-                    models.Q(email=user.email) | 
-                    models.Q(enrollment_number=user.username.upper())
-                ).first()
-                if student:
-                    # Link the student to user if found
-                    student.user = user
-                    student.save()
-                    return PlacementProgress.objects.filter(student=student)
-        return PlacementProgress.objects.none()
-    
+        return self.eager_load(self.get_scoped_queryset())
+
+    def get_scoped_queryset(self):
+        return scope_queryset(self.request, PlacementProgress.objects.all(), "student")
+
     @action(detail=False, methods=["get"])
     def my_progress(self, request):
         """Get current user's placement progress with debug info"""
         user = request.user
+        student_id = get_student_id(request)
         
         debug_info = {
             "user_id": user.id,
@@ -221,8 +350,8 @@ class PlacementProgressViewSet(viewsets.ModelViewSet):
             "email": user.email,
             "role": user.role,
             "is_student": user.is_student,
-            "has_student_profile": hasattr(user, "student_profile"),
-            "student_profile_id": user.student_profile.id if hasattr(user, "student_profile") and user.student_profile else None,
+            "has_student_profile": student_id is not None,
+            "student_profile_id": student_id,
         }
         
         # Get placement progress
@@ -231,105 +360,208 @@ class PlacementProgressViewSet(viewsets.ModelViewSet):
         
         return Response({
             "debug": debug_info,
-            "count": queryset.count(),
+            "count": len(serializer.data),
             "results": serializer.data
         })
 
+    def get_statistics_validators(self, request, *args, **kwargs):
+        # Every delta and rebuild stamps the counters it touches
+        last_modified, count = probe(PlacementStatistic.objects.all())
+        return make_etag("statistics", last_modified, count), last_modified
+
     @action(detail=False, methods=["get"])
+    @conditional_get("get_statistics_validators")
     def statistics(self, request):
-        """Get placement statistics"""
-        total_students = Student.objects.count()
-        placed_students = Student.objects.filter(is_placed=True).count()
-        total_companies = Company.objects.filter(is_active=True).count()
-        total_applications = PlacementProgress.objects.count()
-
-        offers_received = PlacementProgress.objects.filter(
-            status="OFFER_RECEIVED"
-        ).count()
-
-        offers_accepted = PlacementProgress.objects.filter(
-            status="OFFER_ACCEPTED"
-        ).count()
-
-        # Get average package
-        avg_package = (
-            Company.objects.filter(applicants__status="OFFER_ACCEPTED").aggregate(
-                Avg("package_offered")
-            )["package_offered__avg"]
-            or 0
-        )
+        """Get placement statistics from the persisted snapshot"""
+        return Response(get_statistics())
 
-        # Status breakdown
-        status_breakdown = PlacementProgress.objects.values("status").annotate(
-            count=Count("id")
-        )
-
-        # Branch-wise placement
-        branch_stats = (
-            Student.objects.filter(is_placed=True)
-            .values("branch")
-            .annotate(count=Count("id"))
-        )
+    def get_trend_validators(self, request, *args, **kwargs):
+        last_modified, count = probe(PlacementTrend.objects.all(), "computed_at")
+        return make_etag("trend", request.get_full_path(), last_modified, count), last_modified
 
-        return Response(
-            {
-                "total_students": total_students,
-                "placed_students": placed_students,
-                "placement_percentage": round(
-                    (placed_students / total_students * 100), 2
+    @action(detail=False, methods=["get"], url_path="statistics/trend")
+    @conditional_get("get_trend_validators")
+    def trend(self, request):
+        """
+        Daily placement totals between ?from= and ?to= (default: the last
+        30 days), optionally for one ?branch=
+        """
+        today = timezone.localdate()
+        dates = {}
+        for param, default in [("from", today - timedelta(days=30)), ("to", today)]:
+            value = request.query_params.get(param)
+            try:
+                dates[param] = parse_date(value) if value else default
+            except ValueError:
+                dates[param] = None
+            if dates[param] is None:
+                return Response(
+                    {"error": f"{param} must be a date (YYYY-MM-DD)"},
+                    status=status.HTTP_400_BAD_REQUEST,
                 )
-                if total_students > 0
-                else 0,
-                "total_companies": total_companies,
-                "total_applications": total_applications,
-                "offers_received": offers_received,
-                "offers_accepted": offers_accepted,
-                "average_package": round(avg_package, 2),
-                "status_breakdown": list(status_breakdown),
-                "branch_wise_placement": list(branch_stats),
-            }
+        if dates["from"] > dates["to"]:
+            return Response(
+                {"error": "from must not be after to"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        if (dates["to"] - dates["from"]).days > MAX_TREND_DAYS:
+            return Response(
+                {"error": f"The range may span at most {MAX_TREND_DAYS} days"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        branch = request.query_params.get("branch")
+        return Response({
+            "from": dates["from"],
+            "to": dates["to"],
+            "branch": branch,
+            "results": get_trend(dates["from"], dates["to"], branch),
+        })
+
+    @action(detail=False, methods=["post"], permission_classes=[IsAdmin])
+    def bulk_advance(self, request):
+        """
+        Move many applicants of one company to a stage in one transaction
+        Returns an outcome per progress id
+        """
+        serializer = BulkStageAdvanceSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        report = advance_stage(
+            data["company"],
+            data["stage"],
+            serializer.get_entries(),
+            status=data.get("status"),
+            result=data["result"],
         )
+        updated = sum(1 for row in report if row["outcome"] == "updated")
+        return Response({
+            "updated": updated,
+            "failed": len(report) - updated,
+            "results": report,
+        })
+
+    def get_recent_queryset(self):
+        return self.get_scoped_queryset().order_by("-updated_at")
 
     @action(detail=False, methods=["get"])
     def recent_updates(self, request):
         """Get recent placement updates"""
-        recent = self.queryset.order_by("-updated_at")[:10]
+        recent = self.eager_load(self.get_recent_queryset())[:10]
         serializer = self.get_serializer(recent, many=True)
         return Response(serializer.data)
 
 
-class StageProgressViewSet(viewsets.ModelViewSet):
+class StageProgressViewSet(ConditionalGetMixin, PrefetchViewMixin, viewsets.ModelViewSet):
     queryset = StageProgress.objects.all()
     serializer_class = StageProgressSerializer
     permission_classes = [IsAuthenticated]
+    conditional_versions = ("stages",)
 
     def get_queryset(self):
         """
         Students can only see their own stage progress
         Admins can see all
         """
-        user = self.request.user
-        if user.is_admin or user.is_staff:
-            return StageProgress.objects.all()
-        elif user.is_student and hasattr(user, "student_profile"):
-            return StageProgress.objects.filter(
-                placement_progress__student=user.student_profile
+        return self.eager_load(
+            scope_queryset(
+                self.request, StageProgress.objects.all(), "placement_progress__student"
             )
-        return StageProgress.objects.none()
+        )
 
 
-class ImportantDateViewSet(viewsets.ModelViewSet):
+class ImportantDateViewSet(ConditionalGetMixin, PrefetchViewMixin, viewsets.ModelViewSet):
     queryset = ImportantDate.objects.all()
     serializer_class = ImportantDateSerializer
     permission_classes = [IsAdminOrReadOnly]
+    conditional_versions = ("companies",)
+
+    def get_upcoming_queryset(self):
+        from django.utils import timezone
+
+        return self.get_queryset().filter(event_date__gte=timezone.now(), is_active=True)
+
+    def get_upcoming_validators(self, request, *args, **kwargs):
+        # Past events leave the probed set, so the count moves as time passes
+        last_modified, count = probe(self.get_upcoming_queryset())
+        return make_etag(*self.get_validator_parts(request), last_modified, count), None
 
     @action(detail=False, methods=["get"])
+    @conditional_get("get_upcoming_validators")
+    # Short timeout: events drop out of the list as time passes
+    @cached_response("important_dates", "companies", timeout=60)
     def upcoming(self, request):
         """Get upcoming important dates"""
-        from django.utils import timezone
-
-        upcoming = self.queryset.filter(
-            event_date__gte=timezone.now(), is_active=True
-        ).order_by("event_date")[:10]
+        upcoming = self.get_upcoming_queryset().order_by("event_date")[:10]
         serializer = self.get_serializer(upcoming, many=True)
         return Response(serializer.data)
+
+
+class SearchView(APIView):
+    """
+    Ranked full-text search across students, companies and important dates.
+    Students only find their own profile among student results.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        kinds = [
+            kind.strip()
+            for kind in request.query_params.get("type", "").split(",")
+            if kind.strip()
+        ]
+        unknown = [kind for kind in kinds if kind not in search.KINDS]
+        if unknown:
+            return Response(
+                {"error": f"type must be one of: {', '.join(search.KINDS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            limit = int(request.query_params.get("limit", search.DEFAULT_LIMIT))
+        except ValueError:
+            return Response(
+                {"error": "limit must be a number"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        limit = min(max(limit, 1), search.MAX_LIMIT)
+
+        all_students = can_see_all(request.user)
+        results = search.search(
+            query,
+            kinds,
+            student_id=None if all_students else get_student_id(request),
+            all_students=all_students,
+            limit=limit,
+        )
+        return Response(
+            {
+                "query": query,
+                "results": [
+                    {
+                        "type": row["kind"],
+                        "id": row["object_id"],
+                        "title": row["title"],
+                        "subtitle": row["subtitle"],
+                        "score": row["score"],
+                    }
+                    for row in results
+                ],
+            }
+        )
+
+
+class DashboardView(APIView):
+    """
+    Every dashboard panel for the caller's role in one response.
+    Per-panel durations are reported in the Server-Timing header.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        start = time.perf_counter()
+        data, timings = build_dashboard(request)
+        timings["total"] = (time.perf_counter() - start) * 1000
+        response = Response(data)
+        response["Server-Timing"] = server_timing(timings)
+        return response
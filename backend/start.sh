@@ -6,6 +6,9 @@ set -e
 echo "Running database migrations..."
 python manage.py migrate --noinput
 
+echo "Creating cache table (only used with the database cache backend)..."
+python manage.py createcachetable
+
 echo "Collecting static files..."
 python manage.py collectstatic --noinput
 
@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { getPlacementStatistics, getPlacementProgress, getCompanies, getImportantDates } from '../services/api';
+import { getDashboard } from '../services/api';
 import { useAuth } from '../context/AuthContext';
 import Statistics from './Statistics';
 
@@ -18,25 +18,14 @@ const Dashboard = () => {
 
   const fetchDashboardData = async () => {
     try {
+      // One request returns every panel for the current role
+      const { data } = await getDashboard();
       if (isStudent) {
-        // Fetch student-specific data
-        const [placementsRes, companiesRes, eventsRes] = await Promise.all([
-          getPlacementProgress(),
-          getCompanies(),
-          getImportantDates()
-        ]);
-        
-        setMyPlacements(placementsRes.data.results || placementsRes.data || []);
-        setEligibleCompanies((companiesRes.data.results || companiesRes.data || [])
-          .filter(c => c.is_active)
-          .slice(0, 6)); // Show top 6
-        setUpcomingEvents((eventsRes.data.results || eventsRes.data || [])
-          .filter(e => new Date(e.event_date) > new Date() && e.is_active)
-          .slice(0, 5)); // Show next 5
+        setMyPlacements(data.my_placements || []);
+        setEligibleCompanies(data.active_companies || []);
+        setUpcomingEvents((data.upcoming_events || []).slice(0, 5)); // Show next 5
       } else {
-        // Fetch admin/company statistics
-        const response = await getPlacementStatistics();
-        setStats(response.data);
+        setStats(data.statistics);
       }
       setLoading(false);
     } catch (error) {
@@ -11,6 +11,7 @@ import { useAuth } from "../context/AuthContext";
 const Students = () => {
     const { isAdmin } = useAuth();
     const [students, setStudents] = useState([]);
+    const [totalCount, setTotalCount] = useState(0);
     const [loading, setLoading] = useState(true);
     const [showForm, setShowForm] = useState(false);
     const [editingStudent, setEditingStudent] = useState(null);
@@ -35,13 +36,27 @@ const Students = () => {
     });
 
     useEffect(() => {
-        fetchStudents();
-    }, []);
+        // Debounce so typing in the search box doesn't fire a request per key
+        const timer = setTimeout(fetchStudents, searchTerm ? 300 : 0);
+        return () => clearTimeout(timer);
+    }, [searchTerm, filterBranch, filterYear, filterPlaced]);
+
+    // Filtering and search run on the server
+    const buildStudentFilters = () => {
+        const params = {};
+        if (searchTerm.trim()) params.search = searchTerm.trim();
+        if (filterBranch !== "ALL") params.branch = filterBranch;
+        if (filterYear !== "ALL") params.year = filterYear;
+        if (filterPlaced !== "ALL") params.is_placed = filterPlaced === "PLACED";
+        return params;
+    };
 
     const fetchStudents = async () => {
         try {
-            const response = await getStudents();
-            setStudents(response.data.results || response.data);
+            const response = await getStudents(buildStudentFilters());
+            const results = response.data.results || response.data;
+            setStudents(results);
+            setTotalCount(response.data.count ?? results.length);
             setLoading(false);
         } catch (error) {
             console.error("Error fetching students:", error);
@@ -187,23 +202,6 @@ CS2021002,Jane Smith,jane@example.com,1234567891,IT,3,9.0,"JavaScript,Node.js,Mo
         resetForm();
     };
 
-    // Filter and search logic
-    const filteredStudents = students.filter(student => {
-        const matchesSearch = 
-            student.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-            student.enrollment_number.toLowerCase().includes(searchTerm.toLowerCase()) ||
-            student.email.toLowerCase().includes(searchTerm.toLowerCase());
-        
-        const matchesBranch = filterBranch === "ALL" || student.branch === filterBranch;
-        const matchesYear = filterYear === "ALL" || student.year === filterYear;
-        const matchesPlaced = 
-            filterPlaced === "ALL" || 
-            (filterPlaced === "PLACED" && student.is_placed) ||
-            (filterPlaced === "UNPLACED" && !student.is_placed);
-        
-        return matchesSearch && matchesBranch && matchesYear && matchesPlaced;
-    });
-
     if (loading) {
         return <div className="loading">Loading students...</div>;
     }
@@ -377,7 +375,7 @@ CS2021002,Jane Smith,jane@example.com,1234567891,IT,3,9.0,"JavaScript,Node.js,Mo
                     </div>
                 </div>
                 <div style={{ marginTop: '1rem', fontSize: '0.875rem', color: '#666' }}>
-                    Showing {filteredStudents.length} of {students.length} students
+                    Showing {students.length} of {totalCount} students
                 </div>
             </div>
 
@@ -627,7 +625,7 @@ CS2021002,Jane Smith,jane@example.com,1234567891,IT,3,9.0,"JavaScript,Node.js,Mo
                         </tr>
                     </thead>
                     <tbody>
-                        {filteredStudents.length === 0 ? (
+                        {students.length === 0 ? (
                             <tr>
                                 <td colSpan={isAdmin ? "8" : "7"} style={{ textAlign: 'center', padding: '2rem', color: '#666' }}>
                                     {searchTerm || filterBranch !== "ALL" || filterYear !== "ALL" || filterPlaced !== "ALL" 
@@ -636,7 +634,7 @@ CS2021002,Jane Smith,jane@example.com,1234567891,IT,3,9.0,"JavaScript,Node.js,Mo
                                 </td>
                             </tr>
                         ) : (
-                            filteredStudents.map((student) => (
+                            students.map((student) => (
                                 <tr key={student.id}>
                                     <td>{student.enrollment_number}</td>
                                     <td>{student.name}</td>
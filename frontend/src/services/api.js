@@ -65,7 +65,7 @@ api.interceptors.response.use(
 );
 
 // Students API
-export const getStudents = () => api.get("/students/");
+export const getStudents = (params) => api.get("/students/", { params });
 export const getStudent = (id) => api.get(`/students/${id}/`);
 export const createStudent = (data) => api.post("/students/", data);
 export const updateStudent = (id, data) => api.put(`/students/${id}/`, data);
@@ -135,4 +135,11 @@ export const deleteImportantDate = (id) =>
     api.delete(`/important-dates/${id}/`);
 export const getUpcomingDates = () => api.get("/important-dates/upcoming/");
 
+// Dashboard API
+export const getDashboard = () => api.get("/dashboard/");
+
+// Search API
+export const search = (q, params) =>
+    api.get("/search/", { params: { q, ...params } });
+
 export default api;